@@ -0,0 +1,183 @@
+"""Micro and macro benchmarks of the rules engine.
+
+Usage: ``python -m benchmarks.engine [--output FILE] [--baseline FILE]``.
+``benchmarks/baselines/engine.json`` is the stored baseline; its times only
+mean something on the machine that recorded it, so record a new one before
+comparing elsewhere. Times of one process can sit well off those of the
+next, so a baseline is the median of a few runs::
+
+    python -m benchmarks.engine --output run1.json  # and run2.json, run3.json
+    python -m benchmarks.report benchmarks/baselines/engine.json run1.json run2.json run3.json
+"""
+import statistics
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from itertools import cycle, islice
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+from game.deck import Deck, DeckFromCacheInitializer, DeckFromCardsInitializer, DeckFromFileInitializer
+from game.game import GameInitializer, GameSettings, PlayerCardApplier
+from game.helpers import can_card_be_applied
+from game.player import Player
+from game.resource import ResourceType
+from game.simulation import HeadlessGame, RandomMovePolicy
+from .report import run_benchmarks
+
+
+SEEDS = (1, 2, 3)
+# Rounds per run; the micro benchmarks need more than the default to settle.
+REPEAT = 15
+# Operations per timed run of each micro benchmark.
+DECK_OPERATION_COUNT = 1000
+DECK_SHUFFLE_COUNT = 20
+RESOURCE_LOOKUP_COUNT = 10000
+CARD_CHECK_COUNT = 10000
+CARD_APPLICATION_COUNT = 200
+
+
+@dataclass(frozen=True)
+class Benchmark:
+
+    """``run(prepare(number))`` performs ``number`` operations on inputs built outside of the timing."""
+
+    run: Callable
+    prepare: Callable[[int], object]
+    number: int
+
+    def time(self):
+        """Time per operation of one run."""
+        state = self.prepare(self.number)
+        started_at = perf_counter()
+        self.run(state)
+        return (perf_counter() - started_at) / self.number
+
+    def trace_memory(self):
+        """Peak memory that one operation allocates on top of its inputs."""
+        state = self.prepare(1)
+        tracemalloc.start()
+        try:
+            start_memory, _ = tracemalloc.get_traced_memory()
+            self.run(state)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak_memory - start_memory
+
+
+def measure(benchmarks: dict[str, Benchmark], repeat: int):
+    """Median time over ``repeat`` rounds and peak memory of every benchmark.
+
+    Every round runs each benchmark once, so a slow spell of the machine costs all of them one round.
+    """
+    times = {name: [] for name in benchmarks}
+    for _ in range(repeat):
+        for name, benchmark in benchmarks.items():
+            times[name].append(benchmark.time())
+    return {
+        name: {"time": statistics.median(times[name]), "memory": benchmark.trace_memory()}
+        for name, benchmark in benchmarks.items()
+    }
+
+
+def get_players(cards, seed: int):
+    """Both players dealt by a seeded game initializer."""
+    first_player, second_player = Player("Player 1"), Player("Player 2")
+    GameInitializer(
+        settings=GameSettings(),
+        deck=Deck(random=Random(seed)),
+        deck_initializer=DeckFromCardsInitializer(cards),
+        first_player=first_player,
+        second_player=second_player,
+    ).initialize()
+    return first_player, second_player
+
+
+def get_filled_deck(cards, card_count: int, seed: int):
+    deck = Deck(random=Random(seed))
+    for card in islice(cycle(cards), card_count):
+        deck.put_underneath(card)
+    return deck
+
+
+def get_game(cards, seed: int):
+    return HeadlessGame(
+        first_player_policy=RandomMovePolicy(seed),
+        second_player_policy=RandomMovePolicy(seed + 1),
+        settings=GameSettings(),
+        deck_initializer=DeckFromCardsInitializer(cards),
+        first_player=Player("Player 1"),
+        second_player=Player("Player 2"),
+        random=Random(seed),
+    )
+
+
+def benchmark_engine(repeat: int):
+    cards = DeckFromCacheInitializer.load_cards()
+    first_player, second_player = get_players(cards, SEEDS[0])
+    benchmarks = {}
+
+    benchmarks["deck from file/initialize"] = Benchmark(
+        lambda decks: [DeckFromFileInitializer.initialize(deck) for deck in decks],
+        lambda number: [Deck() for _ in range(number)],
+        1,
+    )
+    benchmarks["deck/get"] = Benchmark(
+        lambda deck: [deck.get() for _ in range(len(deck))],
+        lambda number: get_filled_deck(cards, number, SEEDS[0]),
+        DECK_OPERATION_COUNT,
+    )
+    benchmarks["deck/shuffle"] = Benchmark(
+        lambda decks: [deck.shuffle() for deck in decks],
+        lambda number: [get_filled_deck(cards, len(cards), SEEDS[0])] * number,
+        DECK_SHUFFLE_COUNT,
+    )
+
+    resource_types = list(islice(cycle(ResourceType), RESOURCE_LOOKUP_COUNT))
+    benchmarks["player/get_resource_by_type"] = Benchmark(
+        lambda resource_types: [
+            first_player.get_resource_by_type(resource_type) for resource_type in resource_types
+        ],
+        lambda number: resource_types[:number],
+        RESOURCE_LOOKUP_COUNT,
+    )
+    checked_cards = list(islice(cycle(cards), CARD_CHECK_COUNT))
+    benchmarks["can_card_be_applied"] = Benchmark(
+        lambda cards: [can_card_be_applied(card, first_player) for card in cards],
+        lambda number: checked_cards[:number],
+        CARD_CHECK_COUNT,
+    )
+
+    def prepare_players(number):
+        return [(first_player.copy(), second_player.copy()) for _ in range(number)]
+
+    for card_index, card in enumerate(cards):
+        card_name = f"{card_index} {card.title}"
+        benchmarks[f"apply card/{card_name}"] = Benchmark(
+            lambda appliers, card=card: [applier.apply_card(card) for applier in appliers],
+            lambda number: [PlayerCardApplier(*players) for players in prepare_players(number)],
+            CARD_APPLICATION_COUNT,
+        )
+        benchmarks[f"card effect/{card_name}"] = Benchmark(
+            lambda players, card=card: [card.effect(*player_pair) for player_pair in players],
+            prepare_players,
+            CARD_APPLICATION_COUNT,
+        )
+
+    for seed in SEEDS:
+        benchmarks[f"game/seed {seed}"] = Benchmark(
+            lambda games: [game.run() for game in games],
+            lambda number, seed=seed: [get_game(cards, seed) for _ in range(number)],
+            1,
+        )
+    return measure(benchmarks, repeat)
+
+
+def main(argv=None):
+    return run_benchmarks("Benchmark the rules engine.", benchmark_engine, argv, repeat=REPEAT)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
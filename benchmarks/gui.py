@@ -0,0 +1,166 @@
+"""Headless benchmark of the pygame board.
+
+Runs ``GraphicalInterface`` under the SDL dummy video driver, so it needs no
+display. Usage: ``python -m benchmarks.gui [--output FILE] [--baseline FILE]``.
+``benchmarks/baselines/gui.json`` is the stored baseline.
+"""
+import os
+import statistics
+import sys
+from random import Random
+from time import perf_counter
+
+from game.deck import DeckFromCacheInitializer, DeckFromCardsInitializer
+from game.game import GameSettings
+from game.interface.gui.assets import clear_asset_cache
+from game.interface.gui.gui import GraphicalInterface
+from game.interface.gui.helpers import get_wrapped_text
+from game.interface.gui.profiler import RenderProfiler
+from game.player import Player
+from game.simulation import HeadlessGame, RandomMovePolicy
+from .report import run_benchmarks
+
+
+WINDOW_SIZES = ((800, 600), (1280, 720), (1920, 1080))
+SEEDS = (1, 2, 3)
+# Successive game states drawn per seed, one player action apart.
+STATE_COUNT = 20
+
+
+class StateRecordingPolicy(RandomMovePolicy):
+
+    """Random moves that keep snapshots of the players they move for, the current player first."""
+
+    def __init__(self, seed: int, states: list):
+        super().__init__(seed)
+        self._states = states
+
+    def __call__(self, player, opponent_player, permitted_actions):
+        if len(self._states) < STATE_COUNT:
+            self._states.append((player.copy(), opponent_player.copy()))
+        return super().__call__(player, opponent_player, permitted_actions)
+
+
+def get_game_states(cards, seed: int):
+    """Player snapshots before each action of a seeded random game."""
+    states = []
+    game = HeadlessGame(
+        first_player_policy=StateRecordingPolicy(seed, states),
+        second_player_policy=StateRecordingPolicy(seed + 1, states),
+        settings=GameSettings(),
+        deck_initializer=DeckFromCardsInitializer(cards),
+        first_player=Player("Player 1"),
+        second_player=Player("Player 2"),
+        random=Random(seed),
+    )
+    game.run()
+    return states
+
+
+class GraphicalInterfaceBenchmark:
+
+    """Times board builds, frames and resizes of one window size.
+
+    The board is driven through the public hooks of ``GraphicalInterface``.
+    Every benchmark is timed ``repeat`` times without instrumentation and the
+    median run is reported; image and render counts come from one more run
+    under ``RenderProfiler``.
+    """
+
+    def __init__(self, cards, size: tuple[int, int], repeat: int):
+        self._cards = cards
+        self._size = size
+        self._repeat = repeat
+        self._profiler = RenderProfiler()
+        self._interface = GraphicalInterface(cards)
+        self._interface.resize(size)
+
+    def close(self):
+        self._interface.close()
+
+    def run(self, seed: int, states):
+        self._show_state(states[0])
+        return {
+            "cold build": self._measure(self._build, setup=self._clear_caches),
+            "build": self._measure(self._build),
+            "frame": self._measure(
+                lambda: self._draw_states(states[1:]),
+                setup=lambda: self._draw_states(states[:1]),
+                count=len(states) - 1,
+            ),
+            "idle frame": self._measure(self._interface.step),
+        }
+
+    def run_card_face_atlas(self):
+        # A rebuilt board starts with an empty card face atlas.
+        return self._measure(self._interface.render_card_faces, setup=self._build, count=len(self._cards))
+
+    def _measure(self, function, *, setup=None, count=1):
+        times = []
+        for _ in range(self._repeat):
+            if setup is not None:
+                setup()
+            started_at = perf_counter()
+            function()
+            times.append((perf_counter() - started_at) / count)
+
+        if setup is not None:
+            setup()
+        self._profiler.enable()
+        try:
+            self._profiler.start_frame()
+            function()
+            self._profiler.end_frame()
+        finally:
+            self._profiler.disable()
+        return {
+            "time": statistics.median(times),
+            "scaled images": self._profiler.last_report.scaled_image_count / count,
+            "renders": sum(timing.count for timing in self._profiler.last_report.render_timings.values()) / count,
+        }
+
+    def _show_state(self, state):
+        self._interface.set_players(*state)
+        self._interface.show_current_state()
+        self._interface.step()
+
+    def _draw_states(self, states):
+        for state in states:
+            self._show_state(state)
+        # Frames are compared with every card face already in the atlas.
+        self._interface.render_card_faces()
+
+    def _build(self):
+        # A resize to the same size rebuilds the board, without the debounce delay.
+        self._interface.resize(self._size)
+
+    @staticmethod
+    def _clear_caches():
+        clear_asset_cache()
+        get_wrapped_text.cache_clear()
+
+
+def benchmark_gui(repeat: int):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    cards = DeckFromCacheInitializer.load_cards()
+    game_states = {seed: get_game_states(cards, seed) for seed in SEEDS}
+    results = {}
+    for size in WINDOW_SIZES:
+        size_name = f"{size[0]}x{size[1]}"
+        benchmark = GraphicalInterfaceBenchmark(cards, size, repeat)
+        try:
+            for seed, states in game_states.items():
+                for name, metrics in benchmark.run(seed, states).items():
+                    results[f"{name}/{size_name}/seed {seed}"] = metrics
+            results[f"card face atlas/{size_name}"] = benchmark.run_card_face_atlas()
+        finally:
+            benchmark.close()
+    return results
+
+
+def main(argv=None):
+    return run_benchmarks("Benchmark the pygame board under the SDL dummy video driver.", benchmark_gui, argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+
+DEFAULT_REPEAT = 5
+# Relative increase of a metric over its baseline that counts as a regression.
+DEFAULT_THRESHOLD = 0.2
+# Times per operation under MICRO_TIME, in seconds, vary by a good 30% between runs on a busy machine,
+# so they get a looser threshold.
+MICRO_TIME = 1e-4
+DEFAULT_MICRO_THRESHOLD = 0.5
+
+# benchmark name -> metric name -> value; every metric is lower-is-better.
+BenchmarkResults = dict[str, dict[str, float]]
+
+
+@dataclass(frozen=True)
+class Comparison:
+
+    name: str
+    metric: str
+    baseline: float
+    value: float
+
+    @property
+    def change(self):
+        """Relative change against the baseline, e.g. 0.25 for 25% slower."""
+        if self.baseline:
+            return self.value / self.baseline - 1
+        return math.inf if self.value else 0.0
+
+    @property
+    def is_micro(self):
+        return self.metric == "time" and self.baseline < MICRO_TIME
+
+    def is_regression(self, threshold: float, micro_threshold: float):
+        return self.change > (micro_threshold if self.is_micro else threshold)
+
+
+def write_results(path: str, results: BenchmarkResults):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "benchmarks": results,
+            },
+            file,
+            ensure_ascii=False,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load_results(path: str) -> BenchmarkResults:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["benchmarks"]
+
+
+def get_median_results(runs: list[BenchmarkResults]) -> BenchmarkResults:
+    """Metric-wise median of several runs, so that no single quick or slow process sets a baseline."""
+    return {
+        name: {metric: statistics.median(results[name][metric] for results in runs) for metric in metrics}
+        for name, metrics in runs[0].items()
+        if all(name in results for results in runs)
+    }
+
+
+def compare_results(results: BenchmarkResults, baseline: BenchmarkResults):
+    """Comparisons of every metric present in both runs. Benchmarks missing from either run are skipped."""
+    return [
+        Comparison(name, metric, baseline[name][metric], value)
+        for name, metrics in results.items()
+        if name in baseline
+        for metric, value in metrics.items()
+        if metric in baseline[name]
+    ]
+
+
+def run_benchmarks(
+    description: str,
+    benchmark: Callable[[int], BenchmarkResults],
+    argv=None,
+    *,
+    repeat: int = DEFAULT_REPEAT,
+):
+    """Command line entry point shared by the benchmark modules. Returns the exit status.
+
+    ``benchmark(repeat)`` returns the results; they are printed, optionally
+    written to JSON and compared with a saved baseline, in which case any
+    regression over the threshold fails the run. ``repeat`` is the default
+    of ``--repeat``.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results with this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative slowdown")
+    parser.add_argument(
+        "--micro-threshold",
+        type=float,
+        default=DEFAULT_MICRO_THRESHOLD,
+        help=f"allowed relative slowdown of times per operation under {MICRO_TIME * 1e6:g}us",
+    )
+    parser.add_argument("--repeat", type=int, default=repeat, help="measurements per benchmark")
+    arguments = parser.parse_args(argv)
+
+    results = benchmark(arguments.repeat)
+    for name, metrics in results.items():
+        print(name, " ".join(f"{metric}={_format_value(metric, value)}" for metric, value in metrics.items()))
+    if arguments.output is not None:
+        write_results(arguments.output, results)
+    if arguments.baseline is None:
+        return 0
+
+    regressions = [
+        comparison
+        for comparison in compare_results(results, load_results(arguments.baseline))
+        if comparison.is_regression(arguments.threshold, arguments.micro_threshold)
+    ]
+    for comparison in regressions:
+        print(
+            f"REGRESSION {comparison.name} {comparison.metric}: "
+            f"{_format_value(comparison.metric, comparison.baseline)} -> "
+            f"{_format_value(comparison.metric, comparison.value)} ({comparison.change:+.0%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+def _format_value(metric: str, value: float):
+    # Times are stored in seconds and memory in bytes, everything else is a count.
+    if metric == "time":
+        return f"{value * 1e6:.1f}us"
+    if metric == "memory":
+        return f"{value / 1024:.1f}KiB"
+    return f"{value:g}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the metric-wise median of saved results as a baseline.")
+    parser.add_argument("output", help="JSON file to write")
+    parser.add_argument("results", nargs="+", help="JSON files written with --output")
+    arguments = parser.parse_args(argv)
+    write_results(arguments.output, get_median_results([load_results(path) for path in arguments.results]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from .card import Card, CardImpact
+from .constants import RESOURCE_TYPE_MAPPING
+from .enums import *
+from .exceptions import InvalidPlayerMoveError
+from .game import GameSettings
+from .resource import RESOURCE_COUNT, ResourceType, get_resource_index
+
+
+CURRENT_PLAYER = 0
+OPPONENT_PLAYER = 1
+
+NO_WINNER = -1
+
+
+MAIN_RESOURCE_INDICES = np.array([get_resource_index(resource) for resource in RESOURCE_TYPE_MAPPING])
+SECONDARY_RESOURCE_INDICES = np.array([get_resource_index(resource) for resource in RESOURCE_TYPE_MAPPING.values()])
+TOWER_INDEX = get_resource_index(ResourceType.TOWER)
+WALL_INDEX = get_resource_index(ResourceType.WALL)
+
+
+class BatchCardTable:
+
+    """Cards as padded (card, impact) arrays of enum values; padding impacts have type 0."""
+
+    def __init__(self, cards: Sequence[Card]):
+        self.cards = tuple(cards)
+        card_count = len(self.cards)
+        impact_count = max(len(card.impacts) for card in self.cards)
+        shape = (card_count, impact_count)
+
+        self.price = np.array([card.price for card in self.cards], dtype=np.int32)
+        self.price_resource = np.array(
+            [get_resource_index(RESOURCE_TYPE_MAPPING[card.resource_type]) for card in self.cards],
+            dtype=np.intp,
+        )
+        self.additional_feature = np.array(
+            [BatchCardTable._get_additional_feature(card) for card in self.cards],
+            dtype=np.int8,
+        )
+
+        self.impact_type = np.zeros(shape, dtype=np.int8)
+        self.impact_resource = np.zeros(shape, dtype=np.intp)
+        self.impact_player = np.zeros(shape, dtype=np.intp)
+        self.impact_action = np.zeros(shape, dtype=np.int8)
+        self.impact_value = np.zeros(shape, dtype=np.int32)
+
+        self.has_condition = np.zeros(shape, dtype=bool)
+        self.condition_value = np.zeros(shape, dtype=np.int8)
+        self.condition_first_player = np.zeros(shape, dtype=np.intp)
+        self.condition_first_resource = np.zeros(shape, dtype=np.intp)
+        self.condition_second_player = np.zeros(shape, dtype=np.intp)
+        self.condition_second_resource = np.zeros(shape, dtype=np.intp)
+        self.condition_is_constant = np.zeros(shape, dtype=bool)
+        self.condition_constant = np.zeros(shape, dtype=np.int32)
+
+        for card_id, card in enumerate(self.cards):
+            for impact_id, impact in enumerate(card.impacts):
+                self._add_impact((card_id, impact_id), impact)
+
+    @staticmethod
+    def _get_additional_feature(card: Card):
+        if card.has_additional_feature(CardAdditionalFeature.DISCARD_AND_PLAY_AGAIN):
+            return CardAdditionalFeature.DISCARD_AND_PLAY_AGAIN.value
+        if card.has_additional_feature(CardAdditionalFeature.PLAY_AGAIN):
+            return CardAdditionalFeature.PLAY_AGAIN.value
+        return 0
+
+    def _add_impact(self, index: tuple[int, int], impact: CardImpact):
+        self.impact_type[index] = impact.type.value
+        self.impact_resource[index] = get_resource_index(impact.resource_type)
+        # Mirrors PlayerCardApplier._apply_card_impact: BOTH targets the opponent.
+        self.impact_player[index] = CURRENT_PLAYER if impact.side == CardImpactSide.SELF else OPPONENT_PLAYER
+        self.impact_action[index] = impact.action.value
+        self.impact_value[index] = impact.value or 0
+
+        if not impact.has_condition:
+            return
+
+        # Mirrors PlayerCardApplier._is_card_impact_condition_met.
+        condition = impact.condition
+        if condition.is_current_player:
+            first_player = second_player = CURRENT_PLAYER
+        elif condition.is_opponent_player:
+            first_player = second_player = OPPONENT_PLAYER
+        else:
+            first_player, second_player = CURRENT_PLAYER, OPPONENT_PLAYER
+
+        self.has_condition[index] = True
+        self.condition_value[index] = condition.condition_value.value
+        self.condition_first_player[index] = first_player
+        self.condition_first_resource[index] = get_resource_index(condition.first_resource_type)
+        self.condition_second_player[index] = second_player
+        self.condition_is_constant[index] = condition.is_single_player and condition.is_single_resource
+        if self.condition_is_constant[index]:
+            self.condition_constant[index] = condition.value
+        else:
+            self.condition_second_resource[index] = get_resource_index(condition.second_resource_type)
+
+
+class BatchGame:
+
+    """N games stepped together: ``(N, 2, 8)`` resources, ``(N, 2, H)`` hands and ``(N, D + 1)`` deck rings."""
+
+    def __init__(
+        self,
+        card_table: BatchCardTable,
+        game_count: int,
+        *,
+        settings: GameSettings = GameSettings(),
+        seed: Optional[int] = None,
+    ):
+        self._table = card_table
+        self._settings = settings
+        self._game_count = game_count
+        self._games = np.arange(game_count)
+        self._random = np.random.default_rng(seed)
+        self._initialize_boundary_values()
+        self._initialize_cards()
+        self._initialize_resources()
+
+        self.current_player = np.zeros(game_count, dtype=np.intp)
+        self.pending_actions = np.ones(game_count, dtype=np.int8)
+        self.turn_count = np.zeros(game_count, dtype=np.int32)
+        self.winner = np.full(game_count, NO_WINNER, dtype=np.int8)
+
+    @property
+    def active(self):
+        return self.winner == NO_WINNER
+
+    @property
+    def is_discard_only(self):
+        return self.pending_actions == 2
+
+    def _initialize_boundary_values(self):
+        self._lower_boundary_values = np.full(RESOURCE_COUNT, np.iinfo(np.int32).min, dtype=np.int32)
+        self._upper_boundary_values = np.full(RESOURCE_COUNT, np.iinfo(np.int32).max, dtype=np.int32)
+        for boundary_value in self._settings.resource_boundary_values:
+            index = get_resource_index(boundary_value.resource_type)
+            match boundary_value.resource_boundary_value_type:
+                case ResourceBoundaryValueType.LOWER:
+                    self._lower_boundary_values[index] = max(self._lower_boundary_values[index], boundary_value.value)
+                case ResourceBoundaryValueType.UPPER:
+                    self._upper_boundary_values[index] = min(self._upper_boundary_values[index], boundary_value.value)
+
+    def _initialize_cards(self):
+        card_count = len(self._table.cards)
+        hand_size = self._settings.player_card_count
+        deck_size = card_count - 2 * hand_size
+
+        order = self._random.permuted(
+            np.tile(np.arange(card_count, dtype=np.int32), (self._game_count, 1)),
+            axis=1,
+        )
+        self.hands = order[:, :2 * hand_size].reshape(self._game_count, 2, hand_size).copy()
+        self.decks = np.zeros((self._game_count, deck_size + 1), dtype=np.int32)
+        self.decks[:, :deck_size] = order[:, 2 * hand_size:]
+        self.deck_heads = np.zeros(self._game_count, dtype=np.intp)
+        self._deck_size = deck_size
+
+    def _initialize_resources(self):
+        settings = self._settings
+        self.resources = np.zeros((self._game_count, 2, RESOURCE_COUNT), dtype=np.int32)
+        self.resources[:, :, MAIN_RESOURCE_INDICES] = settings.initial_main_resource_value
+        self.resources[:, :, SECONDARY_RESOURCE_INDICES] = settings.initial_secondary_resource_value
+        self.resources[:, 0, SECONDARY_RESOURCE_INDICES] += settings.initial_main_resource_value
+        self.resources[:, :, TOWER_INDEX] = settings.initial_tower_value
+        self.resources[:, :, WALL_INDEX] = settings.initial_wall_value
+
+    def get_applicable_cards(self):
+        return self._get_applicable_cards(self._games)
+
+    def _get_applicable_cards(self, games):
+        current_players = self.current_player[games]
+        hands = self.hands[games, current_players]
+        resources = self.resources[games, current_players]
+        secondary_values = np.take_along_axis(resources, self._table.price_resource[hands], axis=1)
+        return (secondary_values >= self._table.price[hands]) & ~self.is_discard_only[games, None]
+
+    def get_random_moves(self, random: Optional[np.random.Generator] = None):
+        random = random if random is not None else self._random
+        games = self._games[self.active]
+        applicable_cards = self._get_applicable_cards(games)
+        # Every slot may be discarded; APPLY is drawn only for applicable slots.
+        scores = random.random((len(games), applicable_cards.shape[1], 2))
+        scores[:, :, PlayerCardAction.APPLY.value - 1][~applicable_cards] = -1
+        flat_moves = scores.reshape(len(games), -1).argmax(axis=1)
+
+        slots = np.zeros(self._game_count, dtype=np.intp)
+        actions = np.full(self._game_count, PlayerCardAction.DISCARD.value, dtype=np.int8)
+        slots[games], actions[games] = np.divmod(flat_moves, 2)
+        actions[games] += 1
+        return slots, actions
+
+    def step(self, slots: np.ndarray, actions: np.ndarray):
+        """Play one card action, given as a ``PlayerCardAction`` value, in every active game."""
+        games = self._games[self.active]
+        slots = np.asarray(slots)[games]
+        actions = np.asarray(actions)[games]
+        is_apply = actions == PlayerCardAction.APPLY.value
+        # Before indexing the hands: numpy would raise IndexError, or wrap negative slots around.
+        self._validate_moves(games, slots, actions, is_apply)
+        cards = self.hands[games, self.current_player[games], slots]
+
+        applied_games = games[is_apply]
+        applied_cards = cards[is_apply]
+        self._decrease_price(applied_games, applied_cards)
+        for impact_id in range(self._table.impact_type.shape[1]):
+            self._apply_impacts(applied_games, applied_cards, impact_id)
+
+        self._replace_cards(games, slots, cards)
+        is_over = np.zeros(len(games), dtype=bool)
+        is_over[is_apply] = self._get_winners(applied_games) != NO_WINNER
+        self._handle_pending_actions(games, cards, is_apply, is_over)
+        self.winner[games] = self._get_winners(games)
+
+    def run(self, policy: Optional[Callable[["BatchGame"], tuple[np.ndarray, np.ndarray]]] = None):
+        policy = policy if policy is not None else BatchGame.get_random_moves
+        while self.active.any():
+            self.step(*policy(self))
+        return self.winner, self.turn_count
+
+    def _validate_moves(self, games, slots, actions, is_apply):
+        is_action_known = is_apply | (actions == PlayerCardAction.DISCARD.value)
+        is_slot_known = (slots >= 0) & (slots < self.hands.shape[2])
+        if not (is_action_known.all() and is_slot_known.all()):
+            raise InvalidPlayerMoveError
+        applicable_cards = self._get_applicable_cards(games[is_apply])
+        if not applicable_cards[np.arange(len(applicable_cards)), slots[is_apply]].all():
+            raise InvalidPlayerMoveError
+
+    def _decrease_price(self, games, cards):
+        players = self.current_player[games]
+        price_resources = self._table.price_resource[cards]
+        values = self.resources[games, players, price_resources]
+        self.resources[games, players, price_resources] = np.maximum(values - self._table.price[cards], 0)
+
+    def _apply_impacts(self, games, cards, impact_id):
+        table = self._table
+        impact_types = table.impact_type[cards, impact_id]
+        is_applied = (impact_types != 0) & self._get_condition_results(games, cards, impact_id)
+        games, cards, impact_types = games[is_applied], cards[is_applied], impact_types[is_applied]
+
+        players = self.current_player[games] ^ table.impact_player[cards, impact_id]
+        values = table.impact_value[cards, impact_id]
+
+        is_resource = impact_types == CardImpactType.RESOURCE.value
+        self._apply_resource_impacts(
+            games[is_resource],
+            players[is_resource],
+            table.impact_resource[cards[is_resource], impact_id],
+            table.impact_action[cards[is_resource], impact_id],
+            values[is_resource],
+        )
+        is_damage = impact_types == CardImpactType.DAMAGE.value
+        self._apply_damage_impacts(games[is_damage], players[is_damage], values[is_damage])
+
+    def _get_condition_results(self, games, cards, impact_id):
+        table = self._table
+        current_players = self.current_player[games]
+        first_values = self.resources[
+            games,
+            current_players ^ table.condition_first_player[cards, impact_id],
+            table.condition_first_resource[cards, impact_id],
+        ]
+        second_values = np.where(
+            table.condition_is_constant[cards, impact_id],
+            table.condition_constant[cards, impact_id],
+            self.resources[
+                games,
+                current_players ^ table.condition_second_player[cards, impact_id],
+                table.condition_second_resource[cards, impact_id],
+            ],
+        )
+        condition_values = table.condition_value[cards, impact_id]
+        results = np.select(
+            [
+                condition_values == CardImpactConditionValue.GREATER_THAN.value,
+                condition_values == CardImpactConditionValue.LESS_THAN.value,
+                condition_values == CardImpactConditionValue.EQUAL.value,
+                condition_values == CardImpactConditionValue.GREATER_THAN_OR_EQUAL.value,
+                condition_values == CardImpactConditionValue.LESS_THAN_OR_EQUAL.value,
+            ],
+            [
+                first_values > second_values,
+                first_values < second_values,
+                first_values == second_values,
+                first_values >= second_values,
+                first_values <= second_values,
+            ],
+            False,
+        )
+        return ~table.has_condition[cards, impact_id] | results
+
+    def _apply_resource_impacts(self, games, players, resources, actions, values):
+        opponent_players = players ^ 1
+        first_values = self.resources[games, players, resources]
+        second_values = self.resources[games, opponent_players, resources]
+        is_swap = actions == CardImpactAction.SWAP.value
+        self.resources[games, players, resources] = np.select(
+            [
+                actions == CardImpactAction.INCREASE.value,
+                actions == CardImpactAction.DECREASE.value,
+                actions == CardImpactAction.MAKE_EQUAL_TO_OPPONENT.value,
+                actions == CardImpactAction.MAKE_EQUAL_TO_GREATER.value,
+                is_swap,
+            ],
+            [
+                first_values + values,
+                np.maximum(first_values - values, 0),
+                second_values,
+                np.maximum(first_values, second_values),
+                second_values,
+            ],
+            first_values,
+        )
+        self.resources[games[is_swap], opponent_players[is_swap], resources[is_swap]] = first_values[is_swap]
+
+    def _apply_damage_impacts(self, games, players, values):
+        wall_values = self.resources[games, players, WALL_INDEX]
+        tower_values = self.resources[games, players, TOWER_INDEX]
+        self.resources[games, players, WALL_INDEX] = np.maximum(wall_values - values, 0)
+        self.resources[games, players, TOWER_INDEX] = np.maximum(
+            tower_values - np.maximum(values - wall_values, 0),
+            0,
+        )
+
+    def _replace_cards(self, games, slots, cards):
+        heads = self.deck_heads[games]
+        capacity = self._deck_size + 1
+        self.decks[games, (heads + self._deck_size) % capacity] = cards
+        self.hands[games, self.current_player[games], slots] = self.decks[games, heads]
+        self.deck_heads[games] = (heads + 1) % capacity
+
+    def _get_winners(self, games):
+        is_lower_reached = (self.resources[games] <= self._lower_boundary_values).any(axis=2)
+        is_upper_reached = (self.resources[games] >= self._upper_boundary_values).any(axis=2)
+        # Mirrors Game._get_winner_player: the first player is checked first.
+        return np.select(
+            [
+                is_upper_reached[:, 0] | is_lower_reached[:, 1],
+                is_upper_reached[:, 1] | is_lower_reached[:, 0],
+            ],
+            [0, 1],
+            NO_WINNER,
+        )
+
+    def _handle_pending_actions(self, games, cards, is_apply, is_over):
+        additional_features = np.where(is_apply, self._table.additional_feature[cards], 0)
+        pending_actions = np.select(
+            [
+                is_over,
+                additional_features == CardAdditionalFeature.DISCARD_AND_PLAY_AGAIN.value,
+                additional_features == CardAdditionalFeature.PLAY_AGAIN.value,
+            ],
+            [0, 2, 1],
+            self.pending_actions[games] - 1,
+        )
+        self.pending_actions[games] = pending_actions
+        self._complete_moves(games[pending_actions == 0])
+
+    def _complete_moves(self, games):
+        next_players = self.current_player[games] ^ 1
+        self.resources[games[:, None], next_players[:, None], SECONDARY_RESOURCE_INDICES] += (
+            self.resources[games[:, None], next_players[:, None], MAIN_RESOURCE_INDICES]
+        )
+        self.current_player[games] = next_players
+        self.pending_actions[games] = 1
+        self.turn_count[games] += 1
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
 from game.enums import *
@@ -18,6 +19,24 @@ class Card:
     def __string__(self):
         return f"{self.title} {self.description}"
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("effect", None)
+        state.pop("affected_resource_types", None)
+        return state
+
+    @cached_property
+    def effect(self):
+        from .compiler import CardCompiler
+
+        return CardCompiler.compile(self)
+
+    @cached_property
+    def affected_resource_types(self):
+        from .compiler import CardCompiler
+
+        return CardCompiler.get_affected_resource_types(self)
+
     def has_additional_feature(self, additional_feature: CardAdditionalFeature):
         return additional_feature in self.additional_features
 
@@ -63,7 +82,7 @@ class CardImpactCondition:
     @property
     def is_single_resource(self):
         return (
-            self.second_resource is None
+            self.second_resource_type is None
             and self.second_resource_side is None
         )
 
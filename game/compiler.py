@@ -0,0 +1,218 @@
+import operator
+from types import MappingProxyType
+from typing import Callable, Optional
+
+from .card import Card, CardImpact, CardImpactCondition
+from .constants import RESOURCE_TYPE_MAPPING
+from .counters import CounterEvent, CounterKey, CounterRegistry
+from .enums import *
+from .player import Player
+
+
+# (current player, opponent player) -> None
+CardEffect = Callable[[Player, Player], None]
+# (current player, opponent player) -> bool
+CardImpactConditionCheck = Callable[[Player, Player], bool]
+# Counts one event of an impact.
+ImpactEventCounter = Callable[[CounterEvent], None]
+
+
+CONDITION_VALUE_OPERATOR_MAPPING = MappingProxyType(
+    {
+        CardImpactConditionValue.GREATER_THAN: operator.gt,
+        CardImpactConditionValue.LESS_THAN: operator.lt,
+        CardImpactConditionValue.EQUAL: operator.eq,
+        CardImpactConditionValue.GREATER_THAN_OR_EQUAL: operator.ge,
+        CardImpactConditionValue.LESS_THAN_OR_EQUAL: operator.le,
+    }
+)
+
+
+class CardCompiler:
+
+    """Turns a card into one effect callable, with the enum dispatch of ``PlayerCardApplier`` resolved once."""
+
+    @staticmethod
+    def compile(card: Card, counters: Optional[CounterRegistry] = None) -> CardEffect:
+        """With ``counters``, the effect also counts condition results and damage spills of every impact."""
+        impact_effects = tuple(
+            CardCompiler._compile_impact(
+                impact,
+                (
+                    CardCompiler._get_impact_event_counter(card, impact_index, counters)
+                    if counters is not None else None
+                ),
+            )
+            for impact_index, impact in enumerate(card.impacts)
+        )
+
+        match impact_effects:
+            case ():
+                def apply_card(current_player: Player, opponent_player: Player):
+                    pass
+            case (impact_effect,):
+                apply_card = impact_effect
+            case _:
+                def apply_card(current_player: Player, opponent_player: Player):
+                    for impact_effect in impact_effects:
+                        impact_effect(current_player, opponent_player)
+
+        return apply_card
+
+    @staticmethod
+    def get_affected_resource_types(card: Card):
+        """Resource types a card may change, as (current player, opponent player) tuples."""
+        affected_resource_types = {
+            CardImpactSide.SELF: {RESOURCE_TYPE_MAPPING[card.resource_type]},
+            CardImpactSide.OPPONENT: set(),
+        }
+
+        for impact in card.impacts:
+            first_side, second_side = (
+                (CardImpactSide.SELF, CardImpactSide.OPPONENT) if impact.side == CardImpactSide.SELF
+                else (CardImpactSide.OPPONENT, CardImpactSide.SELF)
+            )
+            match impact.type:
+                case CardImpactType.RESOURCE:
+                    affected_resource_types[first_side].add(impact.resource_type)
+                    if impact.action == CardImpactAction.SWAP:
+                        affected_resource_types[second_side].add(impact.resource_type)
+                case CardImpactType.DAMAGE:
+                    affected_resource_types[first_side].update((ResourceType.WALL, ResourceType.TOWER))
+
+        return tuple(
+            tuple(sorted(affected_resource_types[side], key=lambda resource_type: resource_type.value))
+            for side in (CardImpactSide.SELF, CardImpactSide.OPPONENT)
+        )
+
+    @staticmethod
+    def _get_impact_event_counter(
+        card: Card,
+        impact_index: int,
+        counters: CounterRegistry,
+    ) -> ImpactEventCounter:
+        keys = {event: CounterKey.of(card, event, impact_index) for event in CounterEvent}
+
+        def count_event(event: CounterEvent):
+            counters.increment(keys[event])
+
+        return count_event
+
+    @staticmethod
+    def _compile_impact(impact: CardImpact, count_event: Optional[ImpactEventCounter] = None) -> CardEffect:
+        match impact.type:
+            case CardImpactType.RESOURCE:
+                impact_effect = CardCompiler._compile_resource_impact(impact)
+            case CardImpactType.DAMAGE:
+                impact_effect = CardCompiler._compile_damage_impact(impact, count_event)
+
+        if impact.side != CardImpactSide.SELF:
+            self_impact_effect = impact_effect
+
+            def impact_effect(current_player: Player, opponent_player: Player):
+                self_impact_effect(opponent_player, current_player)
+
+        if not impact.has_condition:
+            return impact_effect
+
+        unconditional_impact_effect = impact_effect
+        condition_check = CardCompiler._compile_condition(impact.condition)
+
+        if count_event is None:
+            def impact_effect(current_player: Player, opponent_player: Player):
+                if condition_check(current_player, opponent_player):
+                    unconditional_impact_effect(current_player, opponent_player)
+        else:
+            def impact_effect(current_player: Player, opponent_player: Player):
+                if condition_check(current_player, opponent_player):
+                    count_event(CounterEvent.CONDITION_TRUE)
+                    unconditional_impact_effect(current_player, opponent_player)
+                else:
+                    count_event(CounterEvent.CONDITION_FALSE)
+
+        return impact_effect
+
+    @staticmethod
+    def _compile_resource_impact(impact: CardImpact) -> CardEffect:
+        resource_type = impact.resource_type
+        value = impact.value
+
+        match impact.action:
+            case CardImpactAction.INCREASE:
+                def apply_impact(first_player: Player, second_player: Player):
+                    first_player.get_resource_by_type(resource_type).increase_value(value)
+            case CardImpactAction.DECREASE:
+                def apply_impact(first_player: Player, second_player: Player):
+                    first_player.get_resource_by_type(resource_type).decrease_value(value)
+            case CardImpactAction.MAKE_EQUAL_TO_OPPONENT:
+                def apply_impact(first_player: Player, second_player: Player):
+                    first_player.get_resource_by_type(resource_type).value = (
+                        second_player.get_resource_by_type(resource_type).value
+                    )
+            case CardImpactAction.MAKE_EQUAL_TO_GREATER:
+                def apply_impact(first_player: Player, second_player: Player):
+                    first_player_resource = first_player.get_resource_by_type(resource_type)
+                    first_player_resource.value = max(
+                        first_player_resource.value,
+                        second_player.get_resource_by_type(resource_type).value,
+                    )
+            case CardImpactAction.SWAP:
+                def apply_impact(first_player: Player, second_player: Player):
+                    first_player_resource = first_player.get_resource_by_type(resource_type)
+                    second_player_resource = second_player.get_resource_by_type(resource_type)
+                    first_player_resource.value, second_player_resource.value = (
+                        second_player_resource.value,
+                        first_player_resource.value,
+                    )
+
+        return apply_impact
+
+    @staticmethod
+    def _compile_damage_impact(
+        impact: CardImpact,
+        count_event: Optional[ImpactEventCounter] = None,
+    ) -> CardEffect:
+        value = impact.value
+
+        def apply_impact(first_player: Player, second_player: Player):
+            wall_resource = first_player.get_resource_by_type(ResourceType.WALL)
+            decrease_tower_resource_value = value - wall_resource.value
+            wall_resource.decrease_value(value)
+            if decrease_tower_resource_value > 0:
+                first_player.get_resource_by_type(ResourceType.TOWER).decrease_value(decrease_tower_resource_value)
+                if count_event is not None:
+                    count_event(CounterEvent.DAMAGE_SPILLED)
+
+        return apply_impact
+
+    @staticmethod
+    def _compile_condition(condition: CardImpactCondition) -> CardImpactConditionCheck:
+        # Mirrors PlayerCardApplier._is_card_impact_condition_met.
+        compare = CONDITION_VALUE_OPERATOR_MAPPING[condition.condition_value]
+        first_resource_type = condition.first_resource_type
+        second_resource_type = condition.second_resource_type
+
+        if condition.is_current_player or condition.is_opponent_player:
+            is_current_player = condition.is_current_player
+
+            if condition.is_single_resource:
+                value = condition.value
+
+                def check_condition(current_player: Player, opponent_player: Player):
+                    player = current_player if is_current_player else opponent_player
+                    return compare(player.get_resource_by_type(first_resource_type).value, value)
+            else:
+                def check_condition(current_player: Player, opponent_player: Player):
+                    player = current_player if is_current_player else opponent_player
+                    return compare(
+                        player.get_resource_by_type(first_resource_type).value,
+                        player.get_resource_by_type(second_resource_type).value,
+                    )
+        else:
+            def check_condition(current_player: Player, opponent_player: Player):
+                return compare(
+                    current_player.get_resource_by_type(first_resource_type).value,
+                    opponent_player.get_resource_by_type(second_resource_type).value,
+                )
+
+        return check_condition
@@ -0,0 +1,124 @@
+import csv
+import json
+from collections import Counter
+from enum import Enum, auto
+from typing import Iterable, NamedTuple, Optional
+
+from .card import Card
+
+
+class CounterEvent(Enum):
+
+    APPLIED = auto()
+    DISCARDED = auto()
+    CONDITION_TRUE = auto()
+    CONDITION_FALSE = auto()
+    # A DAMAGE impact exceeded the wall and hit the tower.
+    DAMAGE_SPILLED = auto()
+    PLAY_AGAIN = auto()
+    DISCARD_AND_PLAY_AGAIN = auto()
+    # An additional feature triggered by a card played through another one.
+    PLAY_AGAIN_CHAINED = auto()
+
+
+class CounterKey(NamedTuple):
+
+    # Titles are not unique, the description tells such cards apart.
+    card_title: str
+    card_description: str
+    # None for events of the whole card.
+    impact_index: Optional[int]
+    event: CounterEvent
+
+    @classmethod
+    def of(cls, card: Card, event: CounterEvent, impact_index: Optional[int] = None):
+        return cls(card.title, card.description, impact_index, event)
+
+
+class CounterRegistry:
+
+    """Counts of card and impact events; pickles with its counts only, to be merged with ``update``."""
+
+    FIELD_NAMES = ("card_title", "card_description", "impact_index", "event", "count")
+
+    def __init__(self, counts: Iterable[tuple[CounterKey, int]] = ()):
+        self._counts: Counter[CounterKey] = Counter(dict(counts))
+        # Compiled card effects that count their impact events, by card identity.
+        self._card_effects = {}
+
+    def __getstate__(self):
+        return {"_counts": self._counts}
+
+    def __setstate__(self, state):
+        self._counts = state["_counts"]
+        self._card_effects = {}
+
+    def __len__(self):
+        return len(self._counts)
+
+    def increment(self, key: CounterKey):
+        self._counts[key] += 1
+
+    def get_count(self, key: CounterKey):
+        return self._counts[key]
+
+    def update(self, *registries: "CounterRegistry"):
+        for registry in registries:
+            self._counts.update(registry._counts)
+
+    def items(self):
+        return sorted(self._counts.items(), key=lambda item: CounterRegistry._get_sort_key(item[0]))
+
+    def get_card_effect(self, card: Card):
+        """``card.effect`` compiled to count condition results and damage spills into this registry."""
+        try:
+            return self._card_effects[id(card)][1]
+        except KeyError:
+            from .compiler import CardCompiler
+
+            effect = CardCompiler.compile(card, counters=self)
+            self._card_effects[id(card)] = (card, effect)
+            return effect
+
+    def get_rows(self):
+        return [
+            {
+                "card_title": key.card_title,
+                "card_description": key.card_description,
+                "impact_index": key.impact_index,
+                "event": key.event.name,
+                "count": count,
+            }
+            for key, count in self.items()
+        ]
+
+    def write_csv(self, path: str):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, CounterRegistry.FIELD_NAMES)
+            writer.writeheader()
+            writer.writerows(self.get_rows())
+
+    def write_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.get_rows(), file, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def read_json(cls, path: str):
+        with open(path, encoding="utf-8") as file:
+            return cls(
+                (
+                    CounterKey(
+                        row["card_title"],
+                        row["card_description"],
+                        row["impact_index"],
+                        CounterEvent[row["event"]],
+                    ),
+                    row["count"],
+                )
+                for row in json.load(file)
+            )
+
+    @staticmethod
+    def _get_sort_key(key: CounterKey):
+        impact_index = key.impact_index if key.impact_index is not None else -1
+        return key.card_title, key.card_description, impact_index, key.event.value
@@ -1,4 +1,11 @@
-from random import shuffle
+import hashlib
+import marshal
+import os
+import struct
+from array import array
+from enum import Enum
+from random import Random
+from typing import Iterable, Optional
 from xml.etree import ElementTree
 
 from .card import Card, CardImpact, CardImpactCondition
@@ -6,26 +13,292 @@ from .helpers import camel_case_to_snake_case, StrToIntDict
 from .enums import *
 
 
-class Deck:
+class CardTable:
+
+    """Append-only card registry shared by a deck and its copies.
+
+    Cards are keyed by identity because ``Card`` is not hashable; the table
+    keeps a reference to every card, so identities are never reused.
+    """
 
     def __init__(self):
         self._cards: list[Card] = []
+        self._card_ids: dict[int, int] = {}
+
+    def __len__(self):
+        return len(self._cards)
+
+    def __getitem__(self, card_id: int):
+        return self._cards[card_id]
+
+    def get_card_id(self, card: Card):
+        try:
+            return self._card_ids[id(card)]
+        except KeyError:
+            self._card_ids[id(card)] = len(self._cards)
+            self._cards.append(card)
+            return self._card_ids[id(card)]
+
+
+class Deck:
+
+    """Card-id ring buffer over a shared ``CardTable``."""
+
+    INITIAL_CAPACITY = 128
+
+    def __init__(self, *, random: Optional[Random] = None):
+        self._card_table = CardTable()
+        self._card_ids = array("H", bytes(2 * Deck.INITIAL_CAPACITY))
+        self._head = 0
+        self._size = 0
+        self._random = random if random is not None else Random()
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def cards(self):
+        return [self._card_table[card_id] for card_id in self._get_card_ids()]
 
     def put_underneath(self, card: Card):
-        self._cards.append(card)
+        if self._size == len(self._card_ids):
+            self._set_card_ids(self._get_card_ids(), capacity=2 * len(self._card_ids))
+        self._card_ids[(self._head + self._size) % len(self._card_ids)] = self._card_table.get_card_id(card)
+        self._size += 1
 
     def get(self):
-        return self._cards.pop(0)
+        if not self._size:
+            raise IndexError("get from empty deck")
+        card_id = self._card_ids[self._head]
+        self._head = (self._head + 1) % len(self._card_ids)
+        self._size -= 1
+        return self._card_table[card_id]
+
+    def put_on_top(self, card: Card):
+        if self._size == len(self._card_ids):
+            self._set_card_ids(self._get_card_ids(), capacity=2 * len(self._card_ids))
+        self._head = (self._head - 1) % len(self._card_ids)
+        self._card_ids[self._head] = self._card_table.get_card_id(card)
+        self._size += 1
+
+    def get_underneath(self):
+        if not self._size:
+            raise IndexError("get from empty deck")
+        self._size -= 1
+        return self._card_table[self._card_ids[(self._head + self._size) % len(self._card_ids)]]
 
     def shuffle(self):
-        shuffle(self._cards)
+        card_ids = self._get_card_ids()
+        self._random.shuffle(card_ids)
+        self._set_card_ids(card_ids, capacity=len(self._card_ids))
+
+    def copy(self, *, random: Optional[Random] = None):
+        deck = Deck.__new__(Deck)
+        deck._card_table = self._card_table
+        deck._card_ids = self._card_ids[:]
+        deck._head = self._head
+        deck._size = self._size
+        deck._random = random if random is not None else self._random
+        return deck
+
+    def _get_card_ids(self):
+        end = self._head + self._size
+        card_ids = self._card_ids[self._head:end]
+        if end > len(self._card_ids):
+            card_ids.extend(self._card_ids[:end - len(self._card_ids)])
+        return card_ids
+
+    def _set_card_ids(self, card_ids: array, *, capacity: int):
+        card_ids.frombytes(bytes(card_ids.itemsize * (capacity - len(card_ids))))
+        self._card_ids = card_ids
+        self._head = 0
+
+
+class DeckFromCardsInitializer:
+
+    def __init__(self, cards: Iterable[Card]):
+        self._cards = tuple(cards)
+
+    @classmethod
+    def from_file(cls):
+        return cls(DeckFromCacheInitializer.load_cards())
+
+    def initialize(self, deck: Deck):
+        for card in self._cards:
+            deck.put_underneath(card)
+
+
+class DeckFromCacheInitializer:
+
+    """Cards of ``cards.xml`` cached as marshalled tuples, keyed by the schema version and the XML hash."""
+
+    CACHE_FILE_PATH = "cards.cache"
+    # Bump whenever Card, CardImpact or CardImpactCondition change their fields.
+    SCHEMA_VERSION = 3
+
+    _MAGIC = b"TTDK"
+    _HEADER = struct.Struct("<4sH32s")
+
+    _RESOURCE_TYPES = tuple(ResourceType)
+    _IMPACT_TYPES = tuple(CardImpactType)
+    _IMPACT_SIDES = tuple(CardImpactSide)
+    _IMPACT_ACTIONS = tuple(CardImpactAction)
+    _CONDITION_VALUES = tuple(CardImpactConditionValue)
+    _ADDITIONAL_FEATURES = tuple(CardAdditionalFeature)
+
+    @staticmethod
+    def initialize(deck: Deck):
+        for card in DeckFromCacheInitializer.load_cards():
+            deck.put_underneath(card)
+
+    @staticmethod
+    def load_cards():
+        with open(DeckFromFileInitializer.FILE_PATH, "rb") as file:
+            header = DeckFromCacheInitializer._get_header(file.read())
+
+        try:
+            with open(DeckFromCacheInitializer.CACHE_FILE_PATH, "rb") as file:
+                cache = file.read()
+        except FileNotFoundError:
+            cache = b""
+
+        if cache[:DeckFromCacheInitializer._HEADER.size] == header:
+            try:
+                return tuple(
+                    DeckFromCacheInitializer._decode_card(record)
+                    for record in marshal.loads(cache[DeckFromCacheInitializer._HEADER.size:])
+                )
+            except (ValueError, EOFError, TypeError, IndexError):
+                pass
+
+        deck = Deck()
+        DeckFromFileInitializer.initialize(deck)
+        cards = tuple(deck.cards)
+        DeckFromCacheInitializer._write_cache(header, cards)
+        return cards
+
+    @staticmethod
+    def _get_header(file_content: bytes):
+        return DeckFromCacheInitializer._HEADER.pack(
+            DeckFromCacheInitializer._MAGIC,
+            DeckFromCacheInitializer.SCHEMA_VERSION,
+            hashlib.sha256(file_content).digest(),
+        )
+
+    @staticmethod
+    def _write_cache(header: bytes, cards: tuple[Card, ...]):
+        temporary_file_path = f"{DeckFromCacheInitializer.CACHE_FILE_PATH}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_file_path, "wb") as file:
+                file.write(header)
+                file.write(
+                    marshal.dumps(tuple(DeckFromCacheInitializer._encode_card(card) for card in cards))
+                )
+            os.replace(temporary_file_path, DeckFromCacheInitializer.CACHE_FILE_PATH)
+        except OSError:
+            # The cache is an optimization only, a read-only checkout still works.
+            try:
+                os.remove(temporary_file_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _encode_card(card: Card):
+        return (
+            _get_optional_enum_index(card.resource_type),
+            card.title,
+            card.description,
+            card.price,
+            tuple(DeckFromCacheInitializer._encode_card_impact(impact) for impact in card.impacts),
+            tuple(_get_optional_enum_index(feature) for feature in card.additional_features),
+        )
+
+    @staticmethod
+    def _encode_card_impact(impact: CardImpact):
+        return (
+            _get_optional_enum_index(impact.type),
+            _get_optional_enum_index(impact.resource_type),
+            _get_optional_enum_index(impact.side),
+            _get_optional_enum_index(impact.action),
+            impact.value,
+            (
+                DeckFromCacheInitializer._encode_card_impact_condition(impact.condition)
+                if impact.has_condition else None
+            ),
+        )
+
+    @staticmethod
+    def _encode_card_impact_condition(condition: CardImpactCondition):
+        return (
+            _get_optional_enum_index(condition.first_resource_type),
+            _get_optional_enum_index(condition.first_resource_side),
+            _get_optional_enum_index(condition.condition_value),
+            _get_optional_enum_index(condition.second_resource_type),
+            _get_optional_enum_index(condition.second_resource_side),
+            condition.value,
+        )
+
+    @staticmethod
+    def _decode_card(record: tuple):
+        resource_type, title, description, price, impacts, additional_features = record
+        return Card(
+            resource_type=DeckFromCacheInitializer._RESOURCE_TYPES[resource_type],
+            title=str(title),
+            description=str(description),
+            price=int(price),
+            impacts=[DeckFromCacheInitializer._decode_card_impact(impact) for impact in impacts],
+            additional_features=[
+                DeckFromCacheInitializer._ADDITIONAL_FEATURES[feature] for feature in additional_features
+            ],
+        )
+
+    @staticmethod
+    def _decode_card_impact(record: tuple):
+        impact_type, resource_type, side, action, value, condition = record
+        return CardImpact(
+            type=DeckFromCacheInitializer._IMPACT_TYPES[impact_type],
+            resource_type=DeckFromCacheInitializer._RESOURCE_TYPES[resource_type],
+            side=DeckFromCacheInitializer._IMPACT_SIDES[side],
+            action=DeckFromCacheInitializer._IMPACT_ACTIONS[action],
+            value=_get_optional_int(value),
+            condition=(
+                DeckFromCacheInitializer._decode_card_impact_condition(condition)
+                if condition is not None else None
+            ),
+        )
+
+    @staticmethod
+    def _decode_card_impact_condition(record: tuple):
+        first_type, first_side, condition_value, second_type, second_side, value = record
+        return CardImpactCondition(
+            first_resource_type=DeckFromCacheInitializer._RESOURCE_TYPES[first_type],
+            first_resource_side=DeckFromCacheInitializer._IMPACT_SIDES[first_side],
+            condition_value=DeckFromCacheInitializer._CONDITION_VALUES[condition_value],
+            second_resource_type=_get_optional_member(DeckFromCacheInitializer._RESOURCE_TYPES, second_type),
+            second_resource_side=_get_optional_member(DeckFromCacheInitializer._IMPACT_SIDES, second_side),
+            value=_get_optional_int(value),
+        )
+
+
+def _get_optional_enum_index(value: Optional[Enum]):
+    return tuple(type(value)).index(value) if value is not None else None
+
+
+def _get_optional_member(members: tuple[Enum, ...], index: Optional[int]):
+    return members[index] if index is not None else None
+
+
+def _get_optional_int(value):
+    return int(value) if value is not None else None
 
 
 class DeckFromFileInitializer:
 
+    FILE_PATH = "cards.xml"
+
     @staticmethod
     def initialize(deck: Deck):
-        for card_element in ElementTree.parse('cards.xml').getroot():
+        for card_element in ElementTree.parse(DeckFromFileInitializer.FILE_PATH).getroot():
             deck.put_underneath(
                 DeckFromFileInitializer._build_card(card_element)
             )
@@ -91,3 +364,6 @@ class DeckFromFileInitializer:
             second_resource_side=CardImpactSide[second_resource_side] if second_resource_side else None,
             value=int(value) if value else None
         )
+
+
+DeckInitializer = DeckFromFileInitializer | DeckFromCacheInitializer | DeckFromCardsInitializer
@@ -6,3 +6,13 @@ class NegativeValueError(Exception):
 class PlayerResourceNonFoundError(Exception):
     def __init__(self, *args, **kwargs):
         super().__init__("Player resource not found.")
+
+
+class InvalidPlayerMoveError(Exception):
+    def __init__(self, *args, **kwargs):
+        super().__init__("Invalid player move.")
+
+
+class InterfaceClosedError(Exception):
+    def __init__(self, *args, **kwargs):
+        super().__init__("Interface is closed.")
@@ -1,14 +1,35 @@
 from dataclasses import dataclass
-from typing import Optional
+from random import Random
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
 from .card import Card, CardImpact, CardImpactCondition
 from .constants import *
-from .deck import Deck, DeckFromFileInitializer
+from .counters import CounterEvent, CounterKey, CounterRegistry
+from .deck import Deck, DeckInitializer
 from .enums import *
-from .interface import CommandLineInterface, GraphicalInterface
+from .exceptions import InvalidPlayerMoveError
 from .helpers import get_resource_subtype
+from .journal import (
+    CardDelta,
+    DeckDelta,
+    Delta,
+    Journal,
+    PendingActions,
+    ResourceDelta,
+    ResourceDeltaRecorder,
+    TurnDelta,
+)
 from .player import Player
-from .resource import Resource
+from .resource import Resource, ResourceBoundaryTable
+from .tracing import traced
+
+if TYPE_CHECKING:
+    # Only for annotations: the interfaces, and pygame with the GUI, load when a caller creates one.
+    from .interface import CommandLineInterface, GraphicalInterface
+
+
+# (current player, opponent player, permitted actions) -> (card, action)
+MovePolicy = Callable[[Player, Player, list[PlayerCardAction]], tuple[Card, PlayerCardAction]]
 
 
 @dataclass(frozen=True)
@@ -29,7 +50,7 @@ class GameInitializer:
         *,
         settings: GameSettings,
         deck: Deck,
-        deck_initializer: DeckFromFileInitializer,
+        deck_initializer: DeckInitializer,
         first_player: Player,
         second_player: Player,
     ):
@@ -79,22 +100,73 @@ class Game:
     def __init__(
         self,
         *,
-        interface: CommandLineInterface | GraphicalInterface,
+        interface: "CommandLineInterface | GraphicalInterface",
         settings: GameSettings,
-        deck_initializer: DeckFromFileInitializer,
+        deck_initializer: DeckInitializer,
         first_player: Player,
         second_player: Player,
+        random: Optional[Random] = None,
+        journal: Optional[Journal] = None,
+        counters: Optional[CounterRegistry] = None,
+        policies: Optional[dict[Player, MovePolicy]] = None,
     ):
         self._interface = interface
         self._settings = settings
         self._deck_initializer = deck_initializer
         self._first_player = first_player
         self._second_player = second_player
-        self._deck = Deck()
-        self._is_current_player_move_completed = False
-        self._is_current_player_action_completed = False
+        self._deck = Deck(random=random)
+        self._resource_boundary_table = ResourceBoundaryTable(settings.resource_boundary_values)
+        self._reached_resource_boundaries: set[tuple[Player, ResourceType]] = set()
+        self._journal = journal
+        self._journal_deltas: list[Delta] = []
+        self._counters = counters
+        # Players without a policy are asked through the interface.
+        self._policies = policies if policies is not None else {}
+        # Actions granted by PLAY_AGAIN features that the current player still has to play, in order.
+        self._pending_actions: PendingActions = ()
         self._current_player: Player
 
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @property
+    def opponent_player(self):
+        return self._get_opponent_to(self._current_player)
+
+    @property
+    def permitted_actions(self):
+        return self._pending_actions[0] if self._pending_actions else PlayerCardAction.all_actions()
+
+    @property
+    def is_over(self):
+        return self._is_over()
+
+    def initialize(self):
+        """Deal the cards and the resources; ``step`` plays the game from there."""
+        self._initialize()
+
+    def step(self, card: Card, action: PlayerCardAction):
+        """Play one card action of the current player outside the blocking ``run`` loop."""
+        if self._is_over() or not self._is_player_input_valid(card, action, self.permitted_actions):
+            raise InvalidPlayerMoveError
+        self._handle_player_input(card, action)
+
+    def undo(self):
+        self._check_journal()
+        for delta in reversed(self._journal.undo()):
+            self._revert_delta(delta)
+
+    def redo(self):
+        self._check_journal()
+        for delta in self._journal.redo():
+            self._apply_delta(delta)
+
+    def _check_journal(self):
+        if self._journal is None:
+            raise RuntimeError("journaling is disabled")
+
     def run(self):
         try:
             self._initialize()
@@ -104,6 +176,7 @@ class Game:
         except Exception as exception:
             self._interface.show_game_error_message(exception)
 
+    @traced()
     def _initialize(self):
         initializer = GameInitializer(
             settings=self._settings,
@@ -113,67 +186,172 @@ class Game:
             second_player=self._second_player,
         )
         initializer.initialize()
+        self._start()
+
+    def _start(self):
         self._current_player = self._first_player
-        self._interface.set_players(self._current_player, self._get_opponent_to(self._current_player))
+        self._set_interface_players()
+        for player in (self._first_player, self._second_player):
+            self._update_reached_resource_boundaries(player, self._resource_boundary_table.resource_types)
 
+    @traced()
     def _handle_player_move(self):
+        player = self._current_player
+        while self._current_player is player:
+            self._handle_player_action()
+
+    @traced()
+    def _handle_player_action(self):
+        permitted_actions = self.permitted_actions
         while True:
-            self._handle_player_action(PlayerCardAction.all_actions())
-            if self._is_current_player_move_completed:
-                self._apply_move()
-                break
-
-    def _handle_player_action(self, permitted_actions: list[PlayerCardAction]):
-        self._is_current_player_action_completed = False
-        self._is_current_player_move_completed = False
-
-        while not self._is_current_player_action_completed:
-            self._interface.show_current_state()
-            self._interface.show_current_player()
-            card = self._interface.get_player_card(self._current_player)
-            action = self._interface.get_player_card_action()
-            if self._interface.is_player_input_valid(self._current_player, card, action, permitted_actions):
-                match action:
-                    case PlayerCardAction.APPLY:
-                        self._apply_card(card)
-                        self._apply_action(card)
-                        if self._is_over():
-                            break
-                        self._handle_card_additional_features(card)
-                    case PlayerCardAction.DISCARD:
-                        self._apply_action(card)
+            card, action = self._get_player_input(permitted_actions)
+            if self._is_player_input_valid(card, action, permitted_actions):
+                self._handle_player_input(card, action)
+                return
+
+    def _get_player_input(self, permitted_actions: list[PlayerCardAction]):
+        self._interface.show_current_state()
+        self._interface.show_current_player()
+        policy = self._policies.get(self._current_player)
+        if policy is not None:
+            return policy(self._current_player, self.opponent_player, permitted_actions)
+        card = self._interface.get_player_card(self._current_player)
+        action = self._interface.get_player_card_action()
+        return card, action
+
+    def _is_player_input_valid(
+        self,
+        card: Optional[Card],
+        action: Optional[PlayerCardAction],
+        permitted_actions: list[PlayerCardAction],
+    ):
+        return self._interface.is_player_input_valid(self._current_player, card, action, permitted_actions)
+
+    def _handle_player_input(self, card: Card, action: PlayerCardAction):
+        old_player, old_pending_actions = self._current_player, self._pending_actions
+        is_pending_action = bool(old_pending_actions)
+        self._pending_actions = old_pending_actions[1:]
+        match action:
+            case PlayerCardAction.APPLY:
+                self._count_card_event(card, CounterEvent.APPLIED)
+                self._apply_card(card)
+                self._apply_action(card)
+                if self._is_over():
+                    self._pending_actions = ()
+                else:
+                    self._handle_card_additional_features(card, is_pending_action)
+            case PlayerCardAction.DISCARD:
+                self._count_card_event(card, CounterEvent.DISCARDED)
+                self._apply_action(card)
+
+        if not self._pending_actions:
+            self._apply_move()
+        if self._journal is not None:
+            self._journal_deltas.append(
+                TurnDelta(old_player, self._current_player, old_pending_actions, self._pending_actions)
+            )
+            self._journal.record(self._journal_deltas)
+            self._journal_deltas = []
 
     def _apply_action(self, card: Card):
+        card_index = self._current_player.get_card_index(card)
         self._deck.put_underneath(card)
-        self._current_player.add_card(self._deck.get(), self._current_player.get_card_index(card))
-        self._is_current_player_action_completed = True
-        self._is_current_player_move_completed = True
+        drawn_card = self._deck.get()
+        self._current_player.add_card(drawn_card, card_index)
+        if self._journal is not None:
+            self._journal_deltas.append(DeckDelta(card, drawn_card))
+            self._journal_deltas.append(CardDelta(self._current_player, card_index, card, drawn_card))
 
+    @traced(get_args=lambda game, card: {"card": card.title})
     def _apply_card(self, card: Card):
+        opponent_player = self._get_opponent_to(self._current_player)
+        current_player_resource_types, opponent_player_resource_types = card.affected_resource_types
+        if self._journal is not None:
+            recorder = ResourceDeltaRecorder(
+                (
+                    (self._current_player, current_player_resource_types),
+                    (opponent_player, opponent_player_resource_types),
+                )
+            )
         Game._decrease_player_secondary_resources(self._current_player, card)
-        card_applier = PlayerCardApplier(self._current_player, self._get_opponent_to(self._current_player))
-        card_applier.apply_card(card)
-
-    def _handle_card_additional_features(self, card: Card):
+        effect = card.effect if self._counters is None else self._counters.get_card_effect(card)
+        effect(self._current_player, opponent_player)
+        if self._journal is not None:
+            self._journal_deltas.extend(recorder.get_deltas())
+        self._update_reached_resource_boundaries(self._current_player, current_player_resource_types)
+        self._update_reached_resource_boundaries(opponent_player, opponent_player_resource_types)
+
+    def _handle_card_additional_features(self, card: Card, is_pending_action: bool):
         if card.has_additional_feature(CardAdditionalFeature.DISCARD_AND_PLAY_AGAIN):
-            self._handle_player_action(PlayerCardAction.discard_actions())
-            self._handle_player_action(PlayerCardAction.all_actions())
+            self._count_play_again(card, CounterEvent.DISCARD_AND_PLAY_AGAIN, is_pending_action)
+            self._pending_actions = (
+                PlayerCardAction.discard_actions(),
+                PlayerCardAction.all_actions(),
+                *self._pending_actions,
+            )
         elif card.has_additional_feature(CardAdditionalFeature.PLAY_AGAIN):
-            self._handle_player_action(PlayerCardAction.all_actions())
+            self._count_play_again(card, CounterEvent.PLAY_AGAIN, is_pending_action)
+            self._pending_actions = (PlayerCardAction.all_actions(), *self._pending_actions)
+
+    def _count_play_again(self, card: Card, event: CounterEvent, is_pending_action: bool):
+        self._count_card_event(card, event)
+        if is_pending_action:
+            self._count_card_event(card, CounterEvent.PLAY_AGAIN_CHAINED)
+
+    def _count_card_event(self, card: Card, event: CounterEvent):
+        if self._counters is not None:
+            self._counters.increment(CounterKey.of(card, event))
 
     def _apply_move(self):
-        Game._increase_player_secondary_resources(self._get_opponent_to(self._current_player))
-        self._current_player = self._get_opponent_to(self._current_player)
+        next_player = self._get_opponent_to(self._current_player)
+        if self._journal is not None:
+            recorder = ResourceDeltaRecorder(((next_player, RESOURCE_TYPE_MAPPING.values()),))
+        Game._increase_player_secondary_resources(next_player)
+        if self._journal is not None:
+            self._journal_deltas.extend(recorder.get_deltas())
+        self._current_player = next_player
+        self._update_reached_resource_boundaries(self._current_player, RESOURCE_TYPE_MAPPING.values())
+        self._set_interface_players()
+
+    def _set_interface_players(self):
         self._interface.set_players(self._current_player, self._get_opponent_to(self._current_player))
 
+    def _apply_delta(self, delta: Delta):
+        match delta:
+            case ResourceDelta(player, resource_type, _, new_value):
+                player.get_resource_by_type(resource_type).value = new_value
+                self._update_reached_resource_boundaries(player, (resource_type,))
+            case CardDelta(player, index, _, new_card):
+                player.add_card(new_card, index)
+            case DeckDelta(put_card, _):
+                self._deck.put_underneath(put_card)
+                self._deck.get()
+            case TurnDelta(_, new_player, _, new_pending_actions):
+                self._current_player = new_player
+                self._pending_actions = new_pending_actions
+                self._set_interface_players()
+
+    def _revert_delta(self, delta: Delta):
+        match delta:
+            case ResourceDelta(player, resource_type, old_value, _):
+                player.get_resource_by_type(resource_type).value = old_value
+                self._update_reached_resource_boundaries(player, (resource_type,))
+            case CardDelta(player, index, old_card, _):
+                player.add_card(old_card, index)
+            case DeckDelta(_, drawn_card):
+                self._deck.get_underneath()
+                self._deck.put_on_top(drawn_card)
+            case TurnDelta(old_player, _, old_pending_actions, _):
+                self._current_player = old_player
+                self._pending_actions = old_pending_actions
+                self._set_interface_players()
+
     @staticmethod
     def _increase_player_secondary_resources(player: Player):
-        for resource in player.resources:
-            try:
-                resource_sub_type = get_resource_subtype(resource.resource_type)
-                player.get_resource_by_type(resource_sub_type).increase_value(resource.value)
-            except KeyError:
-                pass
+        for resource_type, resource_sub_type in RESOURCE_TYPE_MAPPING.items():
+            player.get_resource_by_type(resource_sub_type).increase_value(
+                player.get_resource_by_type(resource_type).value
+            )
 
     @staticmethod
     def _decrease_player_secondary_resources(player: Player, card: Card):
@@ -185,11 +363,19 @@ class Game:
             return self._second_player
         return self._first_player
 
+    @traced()
     def _is_over(self):
-        return (
-            self._is_player_boundary_values_violated(self._current_player)
-            or self._is_player_boundary_values_violated(self._get_opponent_to(self._current_player))
-        )
+        return bool(self._reached_resource_boundaries)
+
+    def _update_reached_resource_boundaries(self, player: Player, resource_types: Iterable[ResourceType]):
+        for resource_type in resource_types:
+            if self._resource_boundary_table.is_value_reached(
+                resource_type,
+                player.get_resource_by_type(resource_type).value,
+            ):
+                self._reached_resource_boundaries.add((player, resource_type))
+            else:
+                self._reached_resource_boundaries.discard((player, resource_type))
 
     def _get_winner_player(self):
         if self._is_player_won(self._first_player):
@@ -208,64 +394,69 @@ class Game:
             )
         )
 
-    def _is_player_boundary_values_violated(self, player: Player):
-        return (
-            self._is_player_resource_achieve_boundary_value(player, ResourceBoundaryValueType.LOWER)
-            or self._is_player_resource_achieve_boundary_value(player, ResourceBoundaryValueType.UPPER)
-        )
-
     def _is_player_resource_achieve_boundary_value(
         self,
         player: Player,
         boundary_value_type: ResourceBoundaryValueType,
     ):
-        for resource in player.resources:
-            for boundary_value in self._settings.resource_boundary_values:
-                if (
-                    resource.resource_type == boundary_value.resource_type
-                    and boundary_value.resource_boundary_value_type == boundary_value_type
-                ):
-                    match boundary_value_type:
-                        case ResourceBoundaryValueType.LOWER:
-                            return resource.value <= boundary_value.value
-                        case ResourceBoundaryValueType.UPPER:
-                            return resource.value >= boundary_value.value
-
-        return False
+        return any(
+            self._resource_boundary_table.is_value_reached(
+                resource_type,
+                player.get_resource_by_type(resource_type).value,
+                boundary_value_type,
+            )
+            for resource_type in self._resource_boundary_table.resource_types
+        )
 
 
 class PlayerCardApplier:
 
-    def __init__(self, first_player: Player, second_player: Player):
+    def __init__(
+        self,
+        first_player: Player,
+        second_player: Player,
+        counters: Optional[CounterRegistry] = None,
+    ):
         self._current_player = first_player
         self._opponent_player = second_player
+        self._counters = counters
 
     def apply_card(self, card: Card):
-        for impact in card.impacts:
+        for impact_index, impact in enumerate(card.impacts):
             if impact.has_condition:
-                self._apply_card_impact_with_condition(impact)
-            else:
-                self._apply_card_impact(impact)
-
-    def _apply_card_impact_with_condition(self, impact: CardImpact):
-        if (
-            impact.condition.is_current_player
-            and PlayerCardApplier._card_impact_condition_to_boolean(impact.condition, self._current_player)
-        ):
+                is_condition_met = self._is_card_impact_condition_met(impact)
+                if self._counters is not None:
+                    event = CounterEvent.CONDITION_TRUE if is_condition_met else CounterEvent.CONDITION_FALSE
+                    self._counters.increment(CounterKey.of(card, event, impact_index))
+                if not is_condition_met:
+                    continue
+            if self._counters is not None and self._is_damage_spilled(impact):
+                self._counters.increment(CounterKey.of(card, CounterEvent.DAMAGE_SPILLED, impact_index))
             self._apply_card_impact(impact)
-        elif (
-            impact.condition.is_opponent_player
-            and PlayerCardApplier._card_impact_condition_to_boolean(impact.condition, self._opponent_player)
-        ):
-            self._apply_card_impact(impact)
-        elif (
-            PlayerCardApplier._card_impact_condition_to_boolean(
+
+    def _is_damage_spilled(self, impact: CardImpact):
+        if impact.type != CardImpactType.DAMAGE:
+            return False
+        player = self._current_player if impact.side == CardImpactSide.SELF else self._opponent_player
+        return impact.value > player.get_resource_by_type(ResourceType.WALL).value
+
+    def _is_card_impact_condition_met(self, impact: CardImpact):
+        if impact.condition.is_current_player:
+            return PlayerCardApplier._card_impact_condition_to_boolean(
+                impact.condition,
+                self._current_player,
+            )
+        elif impact.condition.is_opponent_player:
+            return PlayerCardApplier._card_impact_condition_to_boolean(
+                impact.condition,
+                self._opponent_player,
+            )
+        else:
+            return PlayerCardApplier._card_impact_condition_to_boolean(
                 impact.condition,
                 self._current_player,
                 self._opponent_player,
             )
-        ):
-            self._apply_card_impact(impact)
 
     def _apply_card_impact(self, impact: CardImpact):
         match impact.side:
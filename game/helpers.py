@@ -30,5 +30,14 @@ def is_player_action_allowed(permitted_actions: list[PlayerCardAction], current_
     return current_action in permitted_actions
 
 
+def get_player_moves(player: Player, permitted_actions: list[PlayerCardAction]):
+    return [
+        (card, action)
+        for card in player.cards
+        for action in permitted_actions
+        if action != PlayerCardAction.APPLY or can_card_be_applied(card, player)
+    ]
+
+
 def camel_case_to_snake_case(string: str):
     return re.sub(r'(?<!^)(?=[A-Z])', '_', string).lower()
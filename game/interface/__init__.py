@@ -1,2 +1,12 @@
 from game.interface.cli import CommandLineInterface
-from game.interface.gui.gui import GraphicalInterface
+
+__all__ = ["CommandLineInterface", "GraphicalInterface"]
+
+
+def __getattr__(name):
+    # The GUI pulls in pygame and the sprites, so it is imported on first use only.
+    if name == "GraphicalInterface":
+        from game.interface.gui.gui import GraphicalInterface
+
+        return GraphicalInterface
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ from game.enums import PlayerCardAction
 from game.helpers import is_player_action_allowed, can_card_be_applied, get_resource_subtype
 from game.player import Player
 from game.resource import ResourceType
+from game.tracing import traced
 
 
 class CommandLineInterface:
@@ -20,16 +21,19 @@ class CommandLineInterface:
         self._current_player = None
         self._opponent_player = None
 
+    @traced(category="interface")
     def set_players(self, first_player: Player, second_player: Player):
         self._current_player = first_player
         self._opponent_player = second_player
 
+    @traced(category="interface")
     def show_current_state(self):
         self._show_player_resources(self._current_player)
         self._show_player_resources(self._opponent_player)
         self._show_player_cards(self._current_player)
 
     @staticmethod
+    @traced(category="interface")
     def get_player_card(player: Player):
         try:
             player_input = int(input("Choose card number: "))
@@ -40,6 +44,7 @@ class CommandLineInterface:
             return None
 
     @staticmethod
+    @traced(category="interface")
     def get_player_card_action():
         try:
             player_input = input("Choose 'a' for apply. Choose 'd' for discard: ")
@@ -50,6 +55,7 @@ class CommandLineInterface:
             return None
 
     @staticmethod
+    @traced(category="interface")
     def is_player_input_valid(
         player: Player,
         card: Card,
@@ -96,13 +102,16 @@ class CommandLineInterface:
             print(f"Can be applied: {can_card_be_applied(card, player)}")
             print()
 
+    @traced(category="interface")
     def show_current_player(self):
         print(f"It's the {self._current_player.name}'s turn")
 
     @staticmethod
+    @traced(category="interface")
     def show_game_over_message(player: Player):
         print(f"{player.name} won.")
 
     @staticmethod
+    @traced(category="interface")
     def show_game_error_message(exception: Exception):
         print(f"Error was occurred: {exception}")
@@ -0,0 +1,90 @@
+import threading
+from functools import lru_cache
+
+import pygame
+
+from .constants import RESOURCE_PATH
+
+
+SCALED_IMAGE_CACHE_SIZE = 256
+
+# Every scaled image requested through ``get_image``, as (name, unrounded size, flip).
+_requested_images = set()
+# Images decoded and scaled on each thread, so a profiler of the render thread skips ``prepare_images`` workers.
+_created_image_counts = threading.local()
+
+
+@lru_cache(maxsize=None)
+def load_image(name: str):
+    """Decode an image from the resources once, converted to the display pixel format if there is a display."""
+    image = pygame.image.load(RESOURCE_PATH / name)
+    _count_created_images("loaded")
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+
+
+def get_image(name: str, size: tuple[float, float], *, flip: bool = False):
+    """Return a shared scaled (and optionally mirrored) copy of an image. Callers must not draw on it."""
+    _requested_images.add((name, (size[0], size[1]), flip))
+    return _get_scaled_image(name, (int(size[0]), int(size[1])), flip)
+
+
+def get_requested_images():
+    """Images requested through ``get_image`` since the last ``clear_requested_images``."""
+    return frozenset(_requested_images)
+
+
+def clear_requested_images():
+    _requested_images.clear()
+
+
+def prepare_images(images, scale: tuple[float, float]):
+    """Decode and scale ahead of time the images of ``get_requested_images`` for a board scaled by ``scale``.
+
+    Only image decoding and scaling happen here, so unlike fonts and text it
+    may run off the render thread. Sizes that the new layout rounds
+    differently are simply scaled again when they are requested.
+    """
+    for name, size, flip in images:
+        _get_scaled_image(name, (int(size[0] * scale[0]), int(size[1] * scale[1])), flip)
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int):
+    """Return the shared default font of a pixel size."""
+    pygame.font.init()
+    return pygame.font.Font(pygame.font.get_default_font(), size)
+
+
+def get_created_image_counts():
+    """Images decoded and scaled images created on the calling thread so far, as (loaded, scaled)."""
+    return getattr(_created_image_counts, "loaded", 0), getattr(_created_image_counts, "scaled", 0)
+
+
+def get_cache_info():
+    """Hit and miss counts of the asset caches by name."""
+    return {
+        "images": load_image.cache_info(),
+        "scaled images": _get_scaled_image.cache_info(),
+        "fonts": get_font.cache_info(),
+    }
+
+
+def clear_asset_cache():
+    """Drop every cached surface and font, e.g. after ``pygame.quit``."""
+    load_image.cache_clear()
+    _get_scaled_image.cache_clear()
+    get_font.cache_clear()
+    _requested_images.clear()
+
+
+@lru_cache(maxsize=SCALED_IMAGE_CACHE_SIZE)
+def _get_scaled_image(name: str, size: tuple[int, int], flip: bool):
+    _count_created_images("scaled")
+    image = pygame.transform.smoothscale(load_image(name), size)
+    return pygame.transform.flip(image, True, False) if flip else image
+
+
+def _count_created_images(kind: str):
+    setattr(_created_image_counts, kind, getattr(_created_image_counts, kind, 0) + 1)
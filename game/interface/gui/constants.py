@@ -8,6 +8,16 @@ from game.resource import ResourceType
 
 RESOURCE_PATH = pathlib.Path(__file__).absolute().parent / "resources"
 
+FRAME_RATE = 60
+# How long an idle board sleeps before it polls the game state anyway, in milliseconds.
+IDLE_EVENT_TIMEOUT = 1000
+STATE_CHANGED_EVENT = pygame.event.custom_type()
+# How long one idle slice may spend pre-rendering card faces, in seconds.
+CARD_FACE_RENDER_TIME_LIMIT = 0.005
+# How long the window size has to stay put before the board is rebuilt for it, in milliseconds.
+RESIZE_DEBOUNCE_TIME = 150
+GAME_BOARD_READY_EVENT = pygame.event.custom_type()
+
 CARD_RESOURCE_BACKGROUND_MAPPING = MappingProxyType({
     ResourceType.MINE: "cardRed2.jpg",
     ResourceType.MONASTERY: "cardBlue2.jpg",
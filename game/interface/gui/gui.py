@@ -1,20 +1,61 @@
-import sys
+import logging
+import math
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional
 
 import pygame
 
+from game.card import Card
+from game.enums import PlayerCardAction
+from game.exceptions import InterfaceClosedError
+from game.helpers import can_card_be_applied, is_player_action_allowed
 from game.interface.gui.constants import (
     BOTTOM_COMPONENT_WIDTH_RATIO,
     BOTTOM_COMPONENT_HEIGHT_RATIO,
     TOP_COMPONENT_WIDTH_RATIO,
     TOP_COMPONENT_HEIGHT_RATIO,
+    CARD_FACE_RENDER_TIME_LIMIT,
+    FRAME_RATE,
+    GAME_BOARD_READY_EVENT,
+    IDLE_EVENT_TIMEOUT,
+    RESIZE_DEBOUNCE_TIME,
+    STATE_CHANGED_EVENT,
 )
+from game.player import Player
+from game.tracing import traced
+from .assets import clear_asset_cache, clear_requested_images, get_requested_images, prepare_images
+from .messages import InputRequestMessage, Message, StateMessage, TextMessage
+from .profiler import RenderProfiler
 from .sprites.bottom import BottomComponentSprite
 from .sprites.top import TopComponentSprite
 
 
+logger = logging.getLogger(__name__)
+
+
 class GraphicalInterface:
 
-    def __init__(self):
+    """Pygame board of the game.
+
+    ``run`` plays the game on an engine thread while this thread runs the
+    render loop. The engine side of the interface only posts messages with
+    player snapshots to the loop and blocks on the queue of clicked moves,
+    so rule evaluation never stalls the window.
+
+    With ``logical_size`` the board is laid out once at that resolution in an
+    offscreen surface, which is scaled to the window in a single pass per
+    presented frame, so resizing never rebuilds the board.
+
+    F3 (or ``profile=True``) toggles a render profiler overlay, which is also
+    logged per frame at the DEBUG level.
+
+    Without ``run``, e.g. in benchmarks, the board is driven on the calling
+    thread with ``step``, ``resize``, ``render_card_faces`` and ``close``.
+    """
+
+    def __init__(self, cards=(), *, logical_size=None, profile=False):
         pygame.init()
         pygame.display.set_caption("Two Towers")
         self._screen = pygame.display.set_mode(
@@ -25,67 +66,370 @@ class GraphicalInterface:
             pygame.RESIZABLE,
         )
         self._clock = pygame.time.Clock()
+        self._cards = tuple(cards)
+        self._render_target = pygame.Surface(logical_size) if logical_size is not None else None
+        self._messages: queue.SimpleQueue[Message] = queue.SimpleQueue()
+        # ``None`` tells a waiting engine thread that the window is closed.
+        self._player_inputs: queue.SimpleQueue[Optional[tuple[int, PlayerCardAction]]] = queue.SimpleQueue()
+        self._closed = threading.Event()
+        # Engine thread state.
         self._current_player = None
         self._opponent_player = None
+        self._player_card_action = None
+        # Render thread state.
         self._running = True
+        self._is_waiting_for_player_input = False
+        self._shown_players = None
+        self._game_board = None
+        self._game_board_size = None
+        self._top_component = None
+        self._bottom_component = None
+        # While resizing: the last full frame, the time the rebuild is due and the images prepared for it.
+        self._resize_preview = None
+        self._resize_deadline = None
+        self._game_board_future = None
+        self._game_board_future_size = None
+        self._game_board_executor = ThreadPoolExecutor(max_workers=1)
+        self._profiler = RenderProfiler()
+        self._profiler_overlay_rect = None
+        if profile:
+            self._profiler.enable()
+
+    def run(self, run_game):
+        """Run ``run_game`` on an engine thread and the render loop here until the window is closed."""
+        engine_thread = threading.Thread(target=run_game, name="engine", daemon=True)
+        engine_thread.start()
+        self._run_render_loop()
 
+    def step(self):
+        """Run one pass of the render loop without waiting for events: handle what was posted and draw."""
+        self._step(pygame.event.get())
+
+    def resize(self, size):
+        """Resize the window and rebuild the board for it right away, without the debounce delay."""
+        self._resize(size)
+        while self._resize_deadline is not None or self._game_board_future is not None:
+            if self._game_board_future is None:
+                self._start_game_board_rebuild()
+            wait((self._game_board_future,))
+            self._swap_game_board()
+
+    def render_card_faces(self):
+        """Render every card face now instead of in idle frames."""
+        if self._bottom_component is not None:
+            self._bottom_component.card_face_atlas.render_pending(math.inf)
+
+    def close(self):
+        """Close the window and release the engine thread. Cached fonts and images do not outlive it."""
+        self._closed.set()
+        self._player_inputs.put(None)
+        self._profiler.disable()
+        self._game_board_executor.shutdown(cancel_futures=True)
+        pygame.quit()
+        clear_asset_cache()
+
+    @traced(category="interface")
     def set_players(self, first_player, second_player):
         self._current_player = first_player
         self._opponent_player = second_player
 
+    @traced(category="interface")
     def show_current_state(self):
-        game_board = self._get_game_board()
+        self._post(
+            StateMessage(
+                self._current_player.copy(),
+                self._opponent_player.copy(),
+            )
+        )
+
+    @traced(category="interface")
+    def show_current_player(self):
+        self._post(TextMessage(f"It's the {self._current_player.name}'s turn"))
+
+    @traced(category="interface")
+    def get_player_card(self, player):
+        self._post(InputRequestMessage())
+        player_input = self._player_inputs.get()
+        if player_input is None:
+            raise InterfaceClosedError
+        index, self._player_card_action = player_input
+        return player.get_card_by_index(index)
+
+    @traced(category="interface")
+    def get_player_card_action(self):
+        return self._player_card_action
+
+    @traced(category="interface")
+    def is_player_input_valid(
+        self,
+        player: Player,
+        card: Card,
+        action: PlayerCardAction,
+        permitted_actions: list[PlayerCardAction],
+    ):
+        if not is_player_action_allowed(permitted_actions, action):
+            self._post(TextMessage("Action is not allowed."))
+            return False
+        if action == PlayerCardAction.APPLY and not can_card_be_applied(card, player):
+            self._post(TextMessage("This card cannot be applied."))
+            return False
+
+        return True
+
+    @traced(category="interface")
+    def show_game_over_message(self, player):
+        self.show_current_state()
+        self._post(TextMessage(f"{player.name} won."))
+
+    @traced(category="interface")
+    def show_game_error_message(self, exception):
+        self._post(TextMessage(f"Error was occurred: {exception}"))
+
+    def _post(self, message):
+        if self._closed.is_set():
+            return
+        self._messages.put(message)
+        pygame.event.post(pygame.event.Event(STATE_CHANGED_EVENT))
+
+    def _run_render_loop(self):
+        try:
+            while self._running:
+                self._step(self._get_events())
+        finally:
+            self.close()
+
+    def _step(self, events):
+        self._profiler.start_frame()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self._running = False
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self._profiler.toggle()
+
+            if event.type == pygame.VIDEORESIZE:
+                self._resize((event.w, event.h))
+
+            if event.type == pygame.WINDOWEXPOSED and self._game_board is not None:
+                self._present_game_board()
+
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._handle_click(event.pos)
+
+            # Rebuilds waited for by ``resize`` leave their events behind.
+            if event.type == GAME_BOARD_READY_EVENT and self._game_board_future is not None:
+                self._swap_game_board()
 
-        while self._running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self._running = False
-                    pygame.quit()
-                    sys.exit()
+        self._handle_messages()
 
-                if event.type == pygame.VIDEORESIZE:
-                    self._screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                    game_board = self._get_game_board()
+        if self._resize_deadline is not None and pygame.time.get_ticks() >= self._resize_deadline:
+            self._start_game_board_rebuild()
 
-            game_board.update()
-            game_board.draw(self._screen)
+        if self._game_board is not None and self._resize_preview is None:
+            self._draw_game_board()
+
+        self._profiler.end_frame()
+
+    def _get_events(self):
+        """Sleep until an event arrives, unless an animation needs the next frame."""
+        if self._resize_deadline is not None:
+            timeout = max(1, self._resize_deadline - pygame.time.get_ticks())
+            return [pygame.event.wait(timeout), *pygame.event.get()]
+
+        if self._game_board is None or self._resize_preview is not None:
+            return [pygame.event.wait(IDLE_EVENT_TIMEOUT), *pygame.event.get()]
+
+        if self._profiler.is_enabled or any(component.is_animating for component in self._game_board):
+            self._clock.tick(FRAME_RATE)
+            return pygame.event.get()
+
+        card_face_atlas = self._bottom_component.card_face_atlas
+        if not card_face_atlas.is_complete and not pygame.event.peek():
+            card_face_atlas.render_pending(CARD_FACE_RENDER_TIME_LIMIT)
+            return pygame.event.get()
+
+        return [pygame.event.wait(IDLE_EVENT_TIMEOUT), *pygame.event.get()]
+
+    def _handle_messages(self):
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                return
+
+            match message:
+                case StateMessage(first_player=first_player, second_player=second_player):
+                    self._shown_players = (first_player, second_player)
+                    if self._game_board is None:
+                        size = self._get_board_surface().get_size()
+                        self._set_game_board(size, *self._get_game_board_components(size))
+                        self._present_game_board()
+                    else:
+                        self._bind_shown_players()
+                case InputRequestMessage():
+                    self._is_waiting_for_player_input = True
+                case TextMessage(text=text):
+                    pygame.display.set_caption(f"Two Towers - {text}")
+
+    def _handle_click(self, position):
+        if not self._is_waiting_for_player_input or self._game_board is None or self._resize_preview is not None:
+            return
+
+        board_width, board_height = self._get_board_surface().get_size()
+        player_input = self._bottom_component.get_player_input(
+            (
+                position[0] * board_width / self._screen.get_width(),
+                position[1] * board_height / self._screen.get_height(),
+            )
+        )
+        if player_input is not None:
+            self._is_waiting_for_player_input = False
+            self._player_inputs.put(player_input)
+
+    def _bind_shown_players(self):
+        first_player, second_player = self._shown_players
+        self._top_component.set_players(first_player, second_player)
+        self._bottom_component.set_player(first_player)
+
+    def _resize(self, size):
+        """Show the last frame scaled to the new size until the board is rebuilt for it."""
+        if self._render_target is not None or self._game_board is None:
+            self._screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+            if self._game_board is not None:
+                self._present_game_board()
+            return
+
+        if self._resize_preview is None:
+            self._resize_preview = self._screen.copy()
+        self._screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self._resize_deadline = pygame.time.get_ticks() + RESIZE_DEBOUNCE_TIME
+        self._present_game_board()
+
+    def _start_game_board_rebuild(self):
+        self._resize_deadline = None
+        if self._game_board_future is not None:
+            # The rebuild in progress is for an outdated size; the next one starts once it is done.
+            return
+        self._game_board_future_size = self._screen.get_size()
+        # Sprites, fonts and text are only touched by this thread, since SDL_ttf is not thread-safe;
+        # the rebuild thread decodes and scales the images of the current board for the new size.
+        self._game_board_future = self._game_board_executor.submit(
+            prepare_images,
+            get_requested_images(),
+            (
+                self._game_board_future_size[0] / self._game_board_size[0],
+                self._game_board_future_size[1] / self._game_board_size[1],
+            ),
+        )
+        self._game_board_future.add_done_callback(
+            lambda future: pygame.event.post(pygame.event.Event(GAME_BOARD_READY_EVENT))
+        )
+
+    def _swap_game_board(self):
+        try:
+            self._game_board_future.result()
+        except Exception:
+            # The board is built all the same; images missing from the cache are scaled while it is.
+            logger.exception("Preparing the board images failed")
+        self._game_board_future = None
+        if self._game_board_future_size != self._screen.get_size():
+            if self._resize_deadline is None:
+                self._start_game_board_rebuild()
+            return
+
+        self._resize_preview = None
+        size = self._screen.get_size()
+        self._set_game_board(size, *self._get_game_board_components(size))
+        self._present_game_board()
+
+    def _set_game_board(self, size, bottom_component, top_component):
+        self._game_board_size = size
+        self._bottom_component = bottom_component
+        self._top_component = top_component
+        self._game_board = pygame.sprite.Group(bottom_component, top_component)
+
+    def _get_board_surface(self):
+        return self._render_target if self._render_target is not None else self._screen
+
+    def _present_game_board(self):
+        if self._resize_preview is not None:
+            pygame.transform.scale(self._resize_preview, self._screen.get_size(), self._screen)
+        else:
+            board_surface = self._get_board_surface()
+            self._game_board.draw(board_surface)
+            self._profiler_overlay_rect = None
+            if self._profiler.is_enabled:
+                self._profiler_overlay_rect = self._profiler.draw_overlay(board_surface)
+            if self._render_target is not None:
+                pygame.transform.smoothscale(self._render_target, self._screen.get_size(), self._screen)
+        pygame.display.flip()
+
+    def _draw_game_board(self):
+        """Push only the changed parts of the board to the display; idle frames present nothing."""
+        board_surface = self._get_board_surface()
+        dirty_rects = [dirty_rect for component in self._game_board for dirty_rect in component.update()]
+        # The area under the last profiler overlay is restored from the components.
+        if self._profiler_overlay_rect is not None:
+            dirty_rects.append(self._profiler_overlay_rect)
+            self._profiler_overlay_rect = None
+        for dirty_rect in dirty_rects:
+            self._blit_game_board(board_surface, dirty_rect)
+        if self._profiler.is_enabled:
+            self._profiler_overlay_rect = self._profiler.draw_overlay(board_surface)
+            dirty_rects.append(self._profiler_overlay_rect)
+
+        if not dirty_rects:
+            return
+        if self._render_target is not None:
+            pygame.transform.smoothscale(self._render_target, self._screen.get_size(), self._screen)
             pygame.display.flip()
-            pygame.display.update()
-            self._clock.tick(60)
+        else:
+            pygame.display.update(dirty_rects)
 
-        pygame.quit()
+    def _blit_game_board(self, surface, area):
+        for component in self._game_board:
+            component_area = area.clip(component.rect)
+            if component_area:
+                surface.blit(
+                    component.image,
+                    component_area,
+                    component_area.move(-component.rect.x, -component.rect.y),
+                )
 
-    def _get_game_board(self,):
-        game_board = pygame.sprite.Group()
-        game_board.add(self._get_bottom_component())
-        game_board.add(self._get_top_component())
-        return game_board
+    def _get_game_board_components(self, size):
+        """Build the board for a window size, without showing it."""
+        # The images of this board are the ones prepared for the next size.
+        clear_requested_images()
+        return self._get_bottom_component(size), self._get_top_component(size)
 
-    def _get_top_component(self):
+    def _get_top_component(self, size):
         top_component_surface = pygame.Surface(
             (
-                self._screen.get_width() / TOP_COMPONENT_WIDTH_RATIO,
-                self._screen.get_height() / TOP_COMPONENT_HEIGHT_RATIO,
+                size[0] / TOP_COMPONENT_WIDTH_RATIO,
+                size[1] / TOP_COMPONENT_HEIGHT_RATIO,
             )
         )
+        first_player, second_player = self._shown_players
         return TopComponentSprite(
-            self._screen,
+            self._get_board_surface(),
             top_component_surface,
             (0, 0),
-            self._current_player,
-            self._opponent_player,
+            first_player,
+            second_player,
         )
 
-    def _get_bottom_component(self):
+    def _get_bottom_component(self, size):
         bottom_component_surface = pygame.Surface(
             (
-                self._screen.get_width() / BOTTOM_COMPONENT_WIDTH_RATIO,
-                self._screen.get_height() / BOTTOM_COMPONENT_HEIGHT_RATIO,
+                size[0] / BOTTOM_COMPONENT_WIDTH_RATIO,
+                size[1] / BOTTOM_COMPONENT_HEIGHT_RATIO,
             )
         )
+        first_player, _ = self._shown_players
         return BottomComponentSprite(
-            self._screen,
+            self._get_board_surface(),
             bottom_component_surface,
-            (0, self._screen.get_height() / 2),
-            self._current_player,
+            (0, size[1] / 2),
+            first_player,
+            self._cards,
         )
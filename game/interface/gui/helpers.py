@@ -1,6 +1,11 @@
+from functools import lru_cache
+
 import pygame
 
 
+WRAPPED_TEXT_CACHE_SIZE = 512
+
+
 # https://www.pygame.org/wiki/TextWrap
 # draw some text into an area of a surface
 # automatically wraps words
@@ -15,15 +20,12 @@ def wrap_text(text, color, rect, font, additional_delimiter=None):
     font_height = font.size("Tg")[1]
 
     while text:
-        i = 1
-
         # determine if the row of text will be outside our area
         if y + font_height > rect.bottom:
             break
 
         # determine maximum width of line
-        while font.size(text[:i])[0] < rect.width and i < len(text):
-            i += 1
+        i = _get_overflow_index(text, rect.width, font)
 
         # if we've wrapped the text, then adjust the wrap to the last word
         if i < len(text):
@@ -42,3 +44,21 @@ def wrap_text(text, color, rect, font, additional_delimiter=None):
         text = text[i:]
 
     return images
+
+
+@lru_cache(maxsize=WRAPPED_TEXT_CACHE_SIZE)
+def get_wrapped_text(text, color, size, font, additional_delimiter=None):
+    """Cached ``wrap_text`` into a ``size`` area. The line surfaces are shared, so callers must not draw on them."""
+    return tuple(wrap_text(text, color, (0, 0, *size), font, additional_delimiter))
+
+
+def _get_overflow_index(text, width, font):
+    # The shortest prefix that does not fit into the width, or the whole text.
+    low, high = 1, len(text)
+    while low < high:
+        middle = (low + high) // 2
+        if font.size(text[:middle])[0] < width:
+            low = middle + 1
+        else:
+            high = middle
+    return low
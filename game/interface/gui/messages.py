@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from game.player import Player
+
+
+@dataclass(frozen=True)
+class StateMessage:
+
+    """Snapshots of the players as they should be drawn, the current player first."""
+
+    first_player: Player
+    second_player: Player
+
+
+@dataclass(frozen=True)
+class InputRequestMessage:
+
+    pass
+
+
+@dataclass(frozen=True)
+class TextMessage:
+
+    text: str
+
+
+# Sent from the engine thread to the render loop.
+Message = StateMessage | InputRequestMessage | TextMessage
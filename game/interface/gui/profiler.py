@@ -0,0 +1,168 @@
+import logging
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+
+import pygame
+
+from .assets import get_cache_info, get_created_image_counts, get_font
+from .helpers import get_wrapped_text
+from .sprites.base import BaseSprite
+
+
+logger = logging.getLogger(__name__)
+
+OVERLAY_FONT_SIZE = 14
+OVERLAY_BACKGROUND_COLOR = (0, 0, 0, 180)
+OVERLAY_TEXT_COLOR = (255, 255, 255)
+
+
+@dataclass
+class SpriteTiming:
+
+    count: int = 0
+    time: float = 0.0
+
+
+@dataclass
+class FrameReport:
+
+    """Render cost of one frame. Sprite times exclude the time of nested sprites."""
+
+    frame_time: float = 0.0
+    build_timings: dict[str, SpriteTiming] = field(default_factory=dict)
+    render_timings: dict[str, SpriteTiming] = field(default_factory=dict)
+    image_load_count: int = 0
+    scaled_image_count: int = 0
+    cache_hit_rates: dict[str, float] = field(default_factory=dict)
+
+    def get_lines(self):
+        lines = [
+            f"frame {self.frame_time * 1000:.2f} ms, "
+            f"{self.scaled_image_count} scaled images, {self.image_load_count} image loads",
+        ]
+        for phase, timings in (("build", self.build_timings), ("render", self.render_timings)):
+            for sprite_class_name, timing in sorted(timings.items(), key=lambda item: -item[1].time):
+                lines.append(f"{phase} {sprite_class_name}: {timing.count} x, {timing.time * 1000:.2f} ms")
+        lines.append(
+            "cache hits: " + ", ".join(f"{name} {rate:.0%}" for name, rate in self.cache_hit_rates.items())
+        )
+        return lines
+
+
+class RenderProfiler:
+
+    """Frame time and render cost of the GUI, shown as an overlay and logged per frame.
+
+    While enabled, sprite builds and renders on the frame thread are timed per class.
+    """
+
+    def __init__(self):
+        self.is_enabled = False
+        self.last_report = FrameReport()
+        self._report = FrameReport()
+        self._frame_started_at = None
+        self._frame_thread_id = None
+        self._created_image_counts = (0, 0)
+        self._overlay = None
+        self._nested_times: list[float] = []
+        self._originals = {}
+
+    def toggle(self):
+        if self.is_enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.is_enabled:
+            return
+        self.is_enabled = True
+        self._originals = {
+            (BaseSprite, "__init__"): BaseSprite.__init__,
+            (BaseSprite, "_render"): BaseSprite._render,
+        }
+        BaseSprite.__init__ = self._get_timed_method(BaseSprite.__init__, "build_timings")
+        BaseSprite._render = self._get_timed_method(BaseSprite._render, "render_timings")
+
+    def disable(self):
+        if not self.is_enabled:
+            return
+        self.is_enabled = False
+        for (owner, name), original in self._originals.items():
+            setattr(owner, name, original)
+        self._originals = {}
+        self._overlay = None
+
+    def start_frame(self):
+        if not self.is_enabled:
+            return
+        self._report = FrameReport()
+        self._frame_thread_id = threading.get_ident()
+        self._created_image_counts = get_created_image_counts()
+        self._frame_started_at = perf_counter()
+
+    def end_frame(self):
+        if not self.is_enabled or self._frame_started_at is None:
+            return
+        report = self._report
+        report.frame_time = perf_counter() - self._frame_started_at
+        loaded_image_count, scaled_image_count = get_created_image_counts()
+        report.image_load_count = loaded_image_count - self._created_image_counts[0]
+        report.scaled_image_count = scaled_image_count - self._created_image_counts[1]
+        cache_info = {**get_cache_info(), "wrapped text": get_wrapped_text.cache_info()}
+        report.cache_hit_rates = {
+            name: info.hits / (info.hits + info.misses) if info.hits + info.misses else 0.0
+            for name, info in cache_info.items()
+        }
+        self._frame_started_at = None
+        self.last_report = report
+        # Rendered here, outside of the measured frame, and only blitted by the next one.
+        self._overlay = self._render_overlay(report)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(" | ".join(report.get_lines()))
+
+    def draw_overlay(self, surface):
+        """Draw the last report onto the top left corner of ``surface`` and return the covered rect."""
+        if self._overlay is None:
+            self._overlay = self._render_overlay(self.last_report)
+        return surface.blit(self._overlay, (0, 0))
+
+    def _render_overlay(self, report):
+        font = get_font(OVERLAY_FONT_SIZE)
+        line_images = [font.render(line, True, OVERLAY_TEXT_COLOR) for line in report.get_lines()]
+        line_height = font.get_linesize()
+        overlay = pygame.Surface(
+            (
+                max(line_image.get_width() for line_image in line_images) + 8,
+                line_height * len(line_images) + 8,
+            ),
+            pygame.SRCALPHA,
+        )
+        overlay.fill(OVERLAY_BACKGROUND_COLOR)
+        for index, line_image in enumerate(line_images):
+            overlay.blit(line_image, (4, 4 + line_height * index))
+        return overlay
+
+    def _get_timed_method(self, method, report_attribute_name):
+        nested_times = self._nested_times
+
+        def timed_method(sprite, *args, **kwargs):
+            if threading.get_ident() != self._frame_thread_id:
+                return method(sprite, *args, **kwargs)
+            # Nested sprites add up their time on this stack, so each class gets the time of its own code only.
+            nested_times.append(0.0)
+            started_at = perf_counter()
+            try:
+                return method(sprite, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - started_at
+                nested_time = nested_times.pop()
+                if nested_times:
+                    nested_times[-1] += elapsed
+                timings = getattr(self._report, report_attribute_name)
+                timing = timings.setdefault(type(sprite).__name__, SpriteTiming())
+                timing.count += 1
+                timing.time += elapsed - nested_time
+
+        return timed_method
@@ -3,21 +3,65 @@ import pygame
 
 class BaseSprite(pygame.sprite.Sprite):
 
+    """A node of the retained sprite tree, re-rendered only when ``_get_state`` or a child changes."""
+
     def __init__(self, parent_surface, surface, position, *args, **kwargs):
         super().__init__()
         self.image = surface
         self.rect = self.image.get_rect().move(position)
         self._parent_surface = parent_surface
-        self._draw_elements()
+        self._is_rendered = False
+        self._state = None
+        self._children = pygame.sprite.Group(*self._create_children())
+        self.update()
+
+    @property
+    def is_animating(self):
+        """Whether the node needs to be redrawn every frame for now."""
+        return any(child.is_animating for child in self._children)
+
+    def set_player(self, player):
+        """Rebind the node and its children to another player."""
+        self._player = player
+        for child in self._children:
+            child.set_player(player)
 
     def update(self):
-        pass
+        """Re-render what changed and return the changed rects in parent coordinates."""
+        dirty_rects = []
+        for child in self._children:
+            dirty_rects.extend(child.update())
+
+        state = self._get_state()
+        if not self._is_rendered or state != self._state:
+            self._state = state
+            self._is_rendered = True
+            self._render(self.image.get_rect())
+            return [self.rect.copy()]
+
+        for dirty_rect in dirty_rects:
+            self._render(dirty_rect)
+        return [dirty_rect.move(self.rect.topleft) for dirty_rect in dirty_rects]
 
     def draw(self):
         self._parent_surface.blit(self.image, self.rect)
 
+    def _render(self, area):
+        self.image.set_clip(area)
+        if self.image.get_flags() & pygame.SRCALPHA:
+            self.image.fill((0, 0, 0, 0))
+        self._draw_elements()
+        self._children.draw(self.image)
+        self.image.set_clip(None)
+
+    def _create_children(self):
+        return []
+
+    def _get_state(self):
+        return None
+
     def _scale_image(self):
         pass
 
     def _draw_elements(self):
-        raise NotImplemented
+        pass
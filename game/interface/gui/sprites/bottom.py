@@ -1,45 +1,51 @@
 import pygame
 
 from .base import BaseSprite
-from .card import CardSprite
-from ..constants import CARD_WIDTH_RATIO, CARD_HEIGHT_RATIO, RESOURCE_PATH
+from .card import CardFaceAtlas, CardSprite
+from ..assets import get_image
+from ..constants import CARD_WIDTH_RATIO, CARD_HEIGHT_RATIO
 
 
 class BottomComponentSprite(BaseSprite):
 
-    def __init__(self, parent_surface, surface, position, player):
+    def __init__(self, parent_surface, surface, position, player, cards=()):
         self._player = player
+        self.card_face_atlas = CardFaceAtlas(
+            (
+                surface.get_width() / CARD_WIDTH_RATIO,
+                surface.get_height() / CARD_HEIGHT_RATIO,
+            ),
+            cards,
+        )
         super().__init__(parent_surface, surface, position)
 
+    def get_player_input(self, position):
+        """(card index, action) of a click at ``position`` in parent coordinates, or None if it misses the cards."""
+        position = (position[0] - self.rect.x, position[1] - self.rect.y)
+        for card_sprite in self._children:
+            action = card_sprite.get_action(position)
+            if action is not None:
+                return card_sprite.index, action
+        return None
+
+    def _create_children(self):
+        return [self._get_card(index) for index in range(len(self._player.cards))]
+
     def _draw_elements(self):
         self._draw_background()
-        self._draw_cards()
 
     def _draw_background(self):
-        background_image = pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / "bgField1.jpg").convert(),
-            self.image.get_size(),
-        )
+        background_image = get_image("bgField1.jpg", self.image.get_size())
         self.image.blit(background_image, (0, 0))
 
-    def _draw_cards(self):
-        group = pygame.sprite.Group()
-        for index, card in enumerate(self._player.cards):
-            card_surface = self._get_card_surface()
-            indent = (self.image.get_width() - card_surface.get_width() * 6) / 7
-            position = (
-                indent + (card_surface.get_width() + indent) * index,
-                (self.image.get_height() - card_surface.get_height()) / 2,
-            )
-            card_sprite = CardSprite(self.image, card_surface, position, card)
-            group.add(card_sprite)
-
-        group.draw(self.image)
+    def _get_card(self, index):
+        card_surface = self._get_card_surface()
+        indent = (self.image.get_width() - card_surface.get_width() * 6) / 7
+        position = (
+            indent + (card_surface.get_width() + indent) * index,
+            (self.image.get_height() - card_surface.get_height()) / 2,
+        )
+        return CardSprite(self.image, card_surface, position, self._player, index, self.card_face_atlas)
 
     def _get_card_surface(self):
-        return pygame.Surface(
-            (
-                self.image.get_width() / CARD_WIDTH_RATIO,
-                self.image.get_height() / CARD_HEIGHT_RATIO,
-            )
-        )
+        return pygame.Surface(self.card_face_atlas.size)
@@ -1,10 +1,10 @@
 import pygame
 
 from .base import BaseSprite
+from ..assets import get_font, get_image
 from ..constants import (
     PLAYER_BUILDINGS_CURRENT_VALUES_WIDTH_RATIO,
     PLAYER_BUILDINGS_CURRENT_VALUES_HEIGHT_RATIO,
-    RESOURCE_PATH,
 )
 from game.resource import ResourceType
 
@@ -17,12 +17,12 @@ class PlayerBuildingSprite(BaseSprite):
         super().__init__(parent_surface, surface, position)
         # self.image.fill(pygame.Color(255, 255, 255), self.image.get_rect().inflate(-1, -1))
 
-    def _draw_elements(self):
-        group = pygame.sprite.Group()
-        group.add(self._get_tower_building())
-        group.add(self._get_wall_building())
-        group.add(self._get_current_values())
-        group.draw(self.image)
+    def _create_children(self):
+        return [
+            self._get_tower_building(),
+            self._get_wall_building(),
+            self._get_current_values(),
+        ]
 
     def _get_current_values(self):
         current_values_surface = pygame.Surface(
@@ -101,6 +101,9 @@ class BuildingSprite(BaseSprite):
     def current_value(self):
         return self._player.get_resource_by_type(self.RESOURCE_TYPE).value
 
+    def _get_state(self):
+        return self.current_value
+
     def _draw_elements(self):
         self.image.blit(
             self._get_image(),
@@ -113,10 +116,7 @@ class BuildingSprite(BaseSprite):
         return max(0, max_height - self.current_value * division_value)
 
     def _get_image(self):
-        return pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / self._get_image_name()),
-            self.image.get_size(),
-        )
+        return get_image(self._get_image_name(), self.image.get_size())
 
     def _get_image_name(self):
         raise NotImplemented
@@ -145,12 +145,14 @@ class PlayerWallSprite(BuildingSprite):
 class BuildingValueSprite(BaseSprite):
 
     def __init__(self, parent_surface, surface, position, player, *, is_first_player):
-        pygame.font.init()
-        self._font = pygame.font.Font(pygame.font.get_default_font(), surface.get_height() // 2)
+        self._font = get_font(surface.get_height() // 2)
         self._player = player
         self._is_first_player = is_first_player
         super().__init__(parent_surface, surface, position)
 
+    def _get_state(self):
+        return self._get_current_value()
+
     def _draw_elements(self):
         value_text = self._font.render(
             self._get_current_value(),
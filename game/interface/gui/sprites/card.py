@@ -1,116 +1,122 @@
+from time import perf_counter
+
 import pygame
 
 from .base import BaseSprite
-from ..constants import CARD_IMAGE_MAPPING, CARD_RESOURCE_BACKGROUND_MAPPING, RESOURCE_PATH
-from ..helpers import wrap_text
+from ..assets import get_font, get_image
+from ..constants import CARD_IMAGE_MAPPING, CARD_RESOURCE_BACKGROUND_MAPPING
+from ..helpers import get_wrapped_text
+from game.enums import PlayerCardAction
 
 
-class CardSprite(BaseSprite):
+class CardFaceAtlas:
 
-    def __init__(self, parent_surface, surface, position, card):
-        pygame.font.init()
-        self._font = pygame.font.Font(
-            pygame.font.get_default_font(),
-            surface.get_height() // 15,
-        )
-        self._card = card
-        super().__init__(parent_surface, surface, position)
+    """Pre-rendered card faces of one pixel size.
 
-    def _draw_elements(self):
-        self._draw_background()
-        self._draw_card_title()
-        self._draw_card_image()
-        self._draw_card_description()
-        self._draw_discard_button()
-        self._draw_price()
-
-    def _draw_background(self):
-        background_image = pygame.transform.smoothscale(
-            pygame.image.load(
-                RESOURCE_PATH
-                / CARD_RESOURCE_BACKGROUND_MAPPING[self._card.resource_type]
-            ),
-            self.image.get_size(),
-        )
-        self.image.blit(background_image, (0, 0))
+    A face is rendered the first time it is requested; ``render_pending``
+    renders the rest of the given cards a few at a time, e.g. while the
+    board is idle. A new size needs a new atlas.
+    """
 
-    def _draw_card_title(self):
-        title_surface = pygame.Surface(
-            (
-                self.image.get_width() / 1.2,
-                self.image.get_height() / 3,
-            )
+    def __init__(self, size, cards=()):
+        self.size = (int(size[0]), int(size[1]))
+        self._font = get_font(self.size[1] // 15)
+        self._faces = {}
+        self._pending_cards = list(cards)
+
+    @property
+    def is_complete(self):
+        return not self._pending_cards
+
+    def get_face(self, card):
+        # Cards are not hashable; the card is kept next to its face so that its id stays taken.
+        try:
+            return self._faces[id(card)][1]
+        except KeyError:
+            face = self._render_face(card)
+            self._faces[id(card)] = (card, face)
+            return face
+
+    def render_pending(self, time_limit):
+        """Render pending faces for up to ``time_limit`` seconds."""
+        deadline = perf_counter() + time_limit
+        while self._pending_cards and perf_counter() < deadline:
+            self.get_face(self._pending_cards.pop())
+
+    def _render_face(self, card):
+        face = pygame.Surface(self.size)
+        self._draw_background(face, card)
+        self._draw_card_title(face, card)
+        self._draw_card_image(face, card)
+        self._draw_card_description(face, card)
+        self._draw_discard_button(face)
+        self._draw_price(face, card)
+        return face
+
+    def _draw_background(self, face, card):
+        background_image = get_image(
+            CARD_RESOURCE_BACKGROUND_MAPPING[card.resource_type],
+            face.get_size(),
         )
-        text_parts = wrap_text(
-            self._card.title,
+        face.blit(background_image, (0, 0))
+
+    def _draw_card_title(self, face, card):
+        text_parts = get_wrapped_text(
+            card.title,
             (255, 255, 255),
-            title_surface.get_rect(),
+            (int(face.get_width() / 1.2), int(face.get_height() / 3)),
             self._font,
             additional_delimiter="-",
         )
         for index, surface in enumerate(text_parts):
-            self.image.blit(
+            face.blit(
                 surface,
                 (
-                    (self.image.get_width() - surface.get_width()) / 2,
-                    self.image.get_height() / 18 + surface.get_height() * index,
+                    (face.get_width() - surface.get_width()) / 2,
+                    face.get_height() / 18 + surface.get_height() * index,
                 ),
             )
 
-    def _draw_card_description(self):
-        description_surface = pygame.Surface(
-            (
-                self.image.get_width() / 1.2,
-                self.image.get_height() / 3,
-            )
-        )
-        text_parts = wrap_text(
-            self._card.description,
+    def _draw_card_description(self, face, card):
+        text_parts = get_wrapped_text(
+            card.description,
             (255, 255, 255),
-            description_surface.get_rect(),
+            (int(face.get_width() / 1.2), int(face.get_height() / 3)),
             self._font,
         )
         for index, surface in enumerate(text_parts):
-            self.image.blit(
+            face.blit(
                 surface,
                 (
-                    (self.image.get_width() - surface.get_width()) / 2,
-                    self.image.get_height() / 1.8 + surface.get_height() * index,
+                    (face.get_width() - surface.get_width()) / 2,
+                    face.get_height() / 1.8 + surface.get_height() * index,
                 ),
             )
 
-    def _draw_card_image(self):
-        card_image = pygame.transform.smoothscale(
-            pygame.image.load(
-                RESOURCE_PATH
-                / "cards"
-                / CARD_IMAGE_MAPPING[self._card.resource_type]
-                / f"{self._card.title}.jpg"
-            ).convert(),
-            (self.image.get_width() / 1.2, self.image.get_height() / 3),
+    def _draw_card_image(self, face, card):
+        card_image = get_image(
+            f"cards/{CARD_IMAGE_MAPPING[card.resource_type]}/{card.title}.jpg",
+            (face.get_width() / 1.2, face.get_height() / 3),
         )
-        self.image.blit(
+        face.blit(
             card_image,
-            (self.image.get_width() / 11.5, self.image.get_height() / 5)
+            (face.get_width() / 11.5, face.get_height() / 5)
         )
 
-    def _draw_discard_button(self):
-        button_image = pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / "btn_minus.png"),
-            (self.image.get_width() / 5, self.image.get_height() / 8),
-        )
-        self.image.blit(
+    def _draw_discard_button(self, face):
+        button_image = get_image("btn_minus.png", (face.get_width() / 5, face.get_height() / 8))
+        face.blit(
             button_image,
-            button_image.get_rect(bottomleft=self.image.get_rect().bottomleft),
+            button_image.get_rect(bottomleft=face.get_rect().bottomleft),
         )
 
-    def _draw_price(self):
-        price_image = pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / "btn_cardValue2r.png"),
-            (self.image.get_width() / 5, self.image.get_height() / 8),
-        )
+    def _draw_price(self, face, card):
+        price_image = get_image(
+            "btn_cardValue2r.png",
+            (face.get_width() / 5, face.get_height() / 8),
+        ).copy()
         secondary_resource_value = self._font.render(
-            str(self._card.price),
+            str(card.price),
             True,
             (0, 0, 0)
         )
@@ -118,7 +124,30 @@ class CardSprite(BaseSprite):
             secondary_resource_value,
             secondary_resource_value.get_rect(center=price_image.get_rect().center),
         )
-        self.image.blit(
+        face.blit(
             price_image,
-            price_image.get_rect(bottomright=self.image.get_rect().bottomright),
+            price_image.get_rect(bottomright=face.get_rect().bottomright),
         )
+
+
+class CardSprite(BaseSprite):
+
+    def __init__(self, parent_surface, surface, position, player, index, card_face_atlas):
+        self._player = player
+        self.index = index
+        self._card_face_atlas = card_face_atlas
+        super().__init__(parent_surface, surface, position)
+
+    def get_action(self, position):
+        """The action a click at ``position`` in parent coordinates stands for, if it hits the card."""
+        if not self.rect.collidepoint(position):
+            return None
+        discard_button_rect = pygame.Rect(0, 0, self.rect.width / 5, self.rect.height / 8)
+        discard_button_rect.bottomleft = self.rect.bottomleft
+        return PlayerCardAction.DISCARD if discard_button_rect.collidepoint(position) else PlayerCardAction.APPLY
+
+    def _get_state(self):
+        return self._player.get_card_by_index(self.index)
+
+    def _draw_elements(self):
+        self.image.blit(self._card_face_atlas.get_face(self._state), (0, 0))
@@ -1,7 +1,7 @@
 import pygame
 
 from .base import BaseSprite
-from ..constants import RESOURCE_PATH
+from ..assets import get_image
 
 
 class DeckSprite(BaseSprite):
@@ -11,10 +11,7 @@ class DeckSprite(BaseSprite):
         self._draw_current_card()
 
     def _draw_deck(self):
-        background_image = pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / "cardBack3.jpg"),
-            (self.image.get_width() / 2, self.image.get_height()),
-        )
+        background_image = get_image("cardBack3.jpg", (self.image.get_width() / 2, self.image.get_height()))
         self.image.blit(
             background_image,
             background_image.get_rect(left=self.image.get_rect().left),
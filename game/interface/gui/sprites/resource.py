@@ -1,6 +1,7 @@
 import pygame
 
 from .base import BaseSprite
+from ..assets import get_font, get_image
 from ..constants import (
     PLAYER_NAME_WIDTH_RATIO,
     PLAYER_NAME_HEIGHT_RATIO,
@@ -8,7 +9,6 @@ from ..constants import (
     RESOURCE_INFO_HEIGHT_RATIO,
     RESOURCE_IMAGES_MAPPING,
     RESOURCE_COLORS_MAPPING,
-    RESOURCE_PATH,
 )
 from game.constants import RESOURCE_TYPE_MAPPING
 from game.helpers import get_resource_subtype
@@ -21,14 +21,14 @@ class PlayerResourceInfoSprite(BaseSprite):
         self._is_first_player = is_first_player
         super().__init__(parent_surface, surface, position)
 
-    def _draw_elements(self):
-        group = pygame.sprite.Group()
-        group.add(self._get_player_name())
-
-        for index, resource_type in enumerate(RESOURCE_TYPE_MAPPING):
-            group.add(self._get_resource_info(index, resource_type))
-
-        group.draw(self.image)
+    def _create_children(self):
+        return [
+            self._get_player_name(),
+            *(
+                self._get_resource_info(index, resource_type)
+                for index, resource_type in enumerate(RESOURCE_TYPE_MAPPING)
+            ),
+        ]
 
     def _get_player_name(self):
         player_name_surface = pygame.Surface(
@@ -71,12 +71,14 @@ class PlayerResourceInfoSprite(BaseSprite):
 class PlayerNameSprite(BaseSprite):
 
     def __init__(self, parent_surface, surface, position, player, *, is_first_player):
-        pygame.font.init()
-        self._font = pygame.font.Font(pygame.font.get_default_font(), surface.get_height() // 2)
+        self._font = get_font(surface.get_height() // 2)
         self._player = player
         self._is_first_player = is_first_player
         super().__init__(parent_surface, surface, position)
 
+    def _get_state(self):
+        return self._player.name
+
     def _draw_elements(self):
         self._draw_player_name()
 
@@ -120,36 +122,39 @@ class ResourceInfoSprite(BaseSprite):
         *,
         is_first_player,
     ):
-        pygame.font.init()
-        self._font = pygame.font.Font(pygame.font.get_default_font(), surface.get_height() // 6)
+        self._font = get_font(surface.get_height() // 6)
         self._player = player
         self._resource_type = resource_type
         self._is_first_player = is_first_player
         super().__init__(parent_surface, surface, position)
 
+    def _get_state(self):
+        return (
+            self._player.get_resource_by_type(self._resource_type).value,
+            self._player.get_resource_by_type(get_resource_subtype(self._resource_type)).value,
+        )
+
     def _draw_elements(self):
+        main_resource_value, secondary_resource_value = self._state
         resource_title = self._font.render(
             str(get_resource_subtype(self._resource_type).name),
             True,
             pygame.Color("#e2d18c"),
         )
         main_resource_value = self._font.render(
-            f"+{self._player.get_resource_by_type(self._resource_type).value}",
+            f"+{main_resource_value}",
             True,
             (255, 255, 255)
         )
         secondary_resource_value = self._font.render(
-            str(self._player.get_resource_by_type(get_resource_subtype(self._resource_type)).value),
+            str(secondary_resource_value),
             True,
             (255, 255, 255)
         )
         gradient = self._get_gradient(
             *RESOURCE_COLORS_MAPPING[self._resource_type],
         )
-        surface_image = pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / "resGlass.png"),
-            (self.image.get_width(), self.image.get_height()),
-        )
+        surface_image = get_image("resGlass.png", self.image.get_size())
         resource_image = self._get_resource_image()
         self.image.blit(gradient, (0, 0))
         self.image.blit(surface_image, (0, 0))
@@ -175,16 +180,10 @@ class ResourceInfoSprite(BaseSprite):
         )
 
     def _get_resource_image(self):
-        image = pygame.transform.smoothscale(
-            pygame.image.load(
-                RESOURCE_PATH
-                / RESOURCE_IMAGES_MAPPING[self._resource_type]
-            ),
+        return get_image(
+            RESOURCE_IMAGES_MAPPING[self._resource_type],
             (self.image.get_width() / 1.3, self.image.get_height() / 1.3),
-        )
-        return (
-            image if self._is_first_player
-            else pygame.transform.flip(image, True, False)
+            flip=not self._is_first_player,
         )
 
     def _get_gradient(self, color_1, color_2):
@@ -4,6 +4,7 @@ from .base import BaseSprite
 from .buildings import PlayerBuildingSprite
 from .deck import DeckSprite
 from .resource import PlayerResourceInfoSprite
+from ..assets import get_image
 from ..constants import (
     CARD_WIDTH_RATIO,
     CARD_HEIGHT_RATIO,
@@ -11,7 +12,6 @@ from ..constants import (
     PLAYER_RESOURCE_INFO_HEIGHT_RATIO,
     PLAYER_BUILDINGS_WIDTH_RATIO,
     PLAYER_BUILDINGS_HEIGHT_RATIO,
-    RESOURCE_PATH,
 )
 
 
@@ -22,21 +22,38 @@ class TopComponentSprite(BaseSprite):
         self._second_player = second_player
         super().__init__(parent_surface, surface, position)
 
+    def set_players(self, first_player, second_player):
+        self._first_player = first_player
+        self._second_player = second_player
+        self._first_player_resource_info.set_player(first_player)
+        self._second_player_resource_info.set_player(second_player)
+        self._first_player_buildings.set_player(first_player)
+        self._second_player_buildings.set_player(second_player)
+
+    def _create_children(self):
+        self._first_player_resource_info = self._get_player_resource_info(
+            self._first_player,
+            is_first_player=True,
+        )
+        self._second_player_resource_info = self._get_player_resource_info(
+            self._second_player,
+            is_first_player=False,
+        )
+        self._first_player_buildings = self._get_player_buildings(self._first_player, is_first_player=True)
+        self._second_player_buildings = self._get_player_buildings(self._second_player, is_first_player=False)
+        return [
+            self._get_deck(),
+            self._first_player_resource_info,
+            self._second_player_resource_info,
+            self._first_player_buildings,
+            self._second_player_buildings,
+        ]
+
     def _draw_elements(self):
         self._draw_background()
-        group = pygame.sprite.Group()
-        group.add(self._get_deck())
-        group.add(self._get_player_resource_info(self._first_player, is_first_player=True))
-        group.add(self._get_player_resource_info(self._second_player, is_first_player=False))
-        group.add(self._get_player_buildings(self._first_player, is_first_player=True))
-        group.add(self._get_player_buildings(self._second_player, is_first_player=False))
-        group.draw(self.image)
 
     def _draw_background(self):
-        background_image = pygame.transform.smoothscale(
-            pygame.image.load(RESOURCE_PATH / "bgField2.jpg").convert(),
-            self.image.get_size(),
-        )
+        background_image = get_image("bgField2.jpg", self.image.get_size())
         self.image.blit(background_image, (0, 0))
 
     def _get_deck(self):
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+from .card import Card
+from .enums import PlayerCardAction
+from .player import Player
+from .resource import ResourceType
+
+
+@dataclass(frozen=True)
+class ResourceDelta:
+
+    player: Player
+    resource_type: ResourceType
+    old_value: int
+    new_value: int
+
+
+@dataclass(frozen=True)
+class CardDelta:
+
+    player: Player
+    index: int
+    old_card: Card
+    new_card: Card
+
+
+@dataclass(frozen=True)
+class DeckDelta:
+
+    put_card: Card
+    drawn_card: Card
+
+
+# Permitted actions of the actions granted by PLAY_AGAIN features, in the order they are played.
+PendingActions = tuple[list[PlayerCardAction], ...]
+
+
+@dataclass(frozen=True)
+class TurnDelta:
+
+    old_player: Player
+    new_player: Player
+    old_pending_actions: PendingActions
+    new_pending_actions: PendingActions
+
+
+Delta = ResourceDelta | CardDelta | DeckDelta | TurnDelta
+
+
+class ResourceDeltaRecorder:
+
+    """Snapshots the given player resources and reports the ones that changed."""
+
+    def __init__(self, player_resource_types: Iterable[tuple[Player, Iterable[ResourceType]]]):
+        self._old_values = [
+            (player, resource_type, player.get_resource_by_type(resource_type).value)
+            for player, resource_types in player_resource_types
+            for resource_type in resource_types
+        ]
+
+    def get_deltas(self):
+        deltas = []
+        for player, resource_type, old_value in self._old_values:
+            new_value = player.get_resource_by_type(resource_type).value
+            if new_value != old_value:
+                deltas.append(ResourceDelta(player, resource_type, old_value, new_value))
+        return deltas
+
+
+class Journal:
+
+    """Per-action delta entries with an undo/redo cursor; recording after an undo drops the redo entries."""
+
+    def __init__(self):
+        self._entries: list[tuple[Delta, ...]] = []
+        self._position = 0
+
+    def __len__(self):
+        return self._position
+
+    @property
+    def entries(self):
+        return self._entries[:self._position]
+
+    @property
+    def can_undo(self):
+        return self._position > 0
+
+    @property
+    def can_redo(self):
+        return self._position < len(self._entries)
+
+    def record(self, deltas: Iterable[Delta]):
+        del self._entries[self._position:]
+        self._entries.append(tuple(deltas))
+        self._position += 1
+
+    def undo(self):
+        if not self.can_undo:
+            raise IndexError("nothing to undo")
+        self._position -= 1
+        return self._entries[self._position]
+
+    def redo(self):
+        if not self.can_redo:
+            raise IndexError("nothing to redo")
+        self._position += 1
+        return self._entries[self._position - 1]
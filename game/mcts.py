@@ -0,0 +1,282 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from random import Random
+from time import perf_counter
+from typing import Optional, Sequence
+
+from .card import Card
+from .deck import CardTable, DeckFromCardsInitializer
+from .enums import PlayerCardAction
+from .game import GameSettings
+from .helpers import get_player_moves
+from .player import Player
+from .resource import Resource, ResourceType
+from .simulation import HeadlessGame
+
+
+DEFAULT_ITERATIONS = 1000
+DEFAULT_EXPLORATION = 0.7
+DEFAULT_TREE_COUNT = 8
+
+# (card id in the search card table, action)
+MoveKey = tuple[int, PlayerCardAction]
+
+
+@dataclass(frozen=True)
+class SearchPosition:
+
+    """What the player to move knows: both resource sets, the own hand and the opponent hand size."""
+
+    resource_values: tuple[int, ...]
+    card_ids: tuple[int, ...]
+    opponent_resource_values: tuple[int, ...]
+    opponent_card_count: int
+    permitted_actions: tuple[PlayerCardAction, ...]
+
+
+class SearchNode:
+
+    def __init__(self, *, is_root_player_move: bool):
+        self.is_root_player_move = is_root_player_move
+        self.children: dict[MoveKey, "SearchNode"] = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.availability = 0
+
+    def get_score(self, exploration: float):
+        return (
+            self.wins / self.visits
+            + exploration * math.sqrt(math.log(self.availability) / self.visits)
+        )
+
+
+class TreePolicy:
+
+    """Both players of one search iteration: UCB inside the tree, one expansion, then random moves."""
+
+    def __init__(self, search: "MonteCarloTreeSearch", root: SearchNode, root_player: Player, random: Random):
+        self._search = search
+        self._node = root
+        self._root_player = root_player
+        self._random = random
+        self._is_in_tree = True
+        self.path: list[SearchNode] = []
+
+    def __call__(self, player: Player, opponent_player: Player, permitted_actions: list[PlayerCardAction]):
+        moves = get_player_moves(player, permitted_actions)
+        if not self._is_in_tree:
+            return self._random.choice(moves)
+
+        legal_moves = {(self._search.get_card_id(card), action): (card, action) for card, action in moves}
+        children = self._node.children
+        untried_move_keys = [move_key for move_key in legal_moves if move_key not in children]
+        for move_key in legal_moves.keys() - untried_move_keys:
+            children[move_key].availability += 1
+
+        if untried_move_keys:
+            move_key = self._random.choice(untried_move_keys)
+            child = SearchNode(is_root_player_move=player is self._root_player)
+            child.availability = 1
+            children[move_key] = child
+            self._is_in_tree = False
+        else:
+            move_key = max(
+                legal_moves.keys(),
+                key=lambda legal_move_key: children[legal_move_key].get_score(self._search.exploration),
+            )
+            child = children[move_key]
+
+        self._node = child
+        self.path.append(child)
+        return legal_moves[move_key]
+
+
+class MonteCarloTreeSearch:
+
+    """Information-set MCTS: every iteration deals the cards the player cannot see at random and plays out."""
+
+    def __init__(
+        self,
+        cards: Sequence[Card],
+        *,
+        settings: GameSettings = GameSettings(),
+        exploration: float = DEFAULT_EXPLORATION,
+    ):
+        self._card_table = CardTable()
+        for card in cards:
+            self._card_table.get_card_id(card)
+        self._settings = settings
+        self.exploration = exploration
+
+    def get_card_id(self, card: Card):
+        return self._card_table.get_card_id(card)
+
+    def get_position(self, player: Player, opponent_player: Player, permitted_actions: list[PlayerCardAction]):
+        return SearchPosition(
+            resource_values=player.resource_values,
+            card_ids=tuple(self.get_card_id(card) for card in player.cards),
+            opponent_resource_values=opponent_player.resource_values,
+            opponent_card_count=len(opponent_player.cards),
+            permitted_actions=tuple(permitted_actions),
+        )
+
+    def search(
+        self,
+        position: SearchPosition,
+        *,
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """Return ``{move key: (visits, wins)}`` for the root moves."""
+        random = Random(seed)
+        root = SearchNode(is_root_player_move=False)
+        deadline = perf_counter() + time_limit if time_limit is not None else None
+        iteration = 0
+
+        while iteration == 0 or (
+            (iterations is None or iteration < iterations)
+            and (deadline is None or perf_counter() < deadline)
+        ):
+            self._run_iteration(root, position, random)
+            iteration += 1
+
+        return {move_key: (child.visits, child.wins) for move_key, child in root.children.items()}
+
+    def _run_iteration(self, root: SearchNode, position: SearchPosition, random: Random):
+        player, opponent_player, deck_cards = self._determinize(position, random)
+        tree_policy = TreePolicy(self, root, player, random)
+        game = HeadlessGame(
+            first_player_policy=tree_policy,
+            second_player_policy=tree_policy,
+            settings=self._settings,
+            deck_initializer=DeckFromCardsInitializer(deck_cards),
+            first_player=player,
+            second_player=opponent_player,
+            random=random,
+        )
+        result = game.run_from_position(list(position.permitted_actions))
+
+        reward = 0.5 if result.winner is None else float(result.winner is player)
+        for node in tree_policy.path:
+            node.visits += 1
+            node.wins += reward if node.is_root_player_move else 1 - reward
+
+    def _determinize(self, position: SearchPosition, random: Random):
+        unseen_card_ids = list(set(range(len(self._card_table))) - set(position.card_ids))
+        random.shuffle(unseen_card_ids)
+
+        player = MonteCarloTreeSearch._get_player("player", position.resource_values)
+        player.cards = [self._card_table[card_id] for card_id in position.card_ids]
+        opponent_player = MonteCarloTreeSearch._get_player("opponent", position.opponent_resource_values)
+        opponent_player.cards = [
+            self._card_table[card_id] for card_id in unseen_card_ids[:position.opponent_card_count]
+        ]
+        deck_cards = [self._card_table[card_id] for card_id in unseen_card_ids[position.opponent_card_count:]]
+        return player, opponent_player, deck_cards
+
+    @staticmethod
+    def _get_player(name: str, resource_values: tuple[int, ...]):
+        player = Player(name)
+        player.resources = [
+            Resource(resource_type, value)
+            for resource_type, value in zip(ResourceType, resource_values)
+        ]
+        return player
+
+
+_worker_search: Optional[MonteCarloTreeSearch] = None
+
+
+def _initialize_worker(cards: Sequence[Card], settings: GameSettings, exploration: float):
+    global _worker_search
+    _worker_search = MonteCarloTreeSearch(cards, settings=settings, exploration=exploration)
+
+
+def _search_in_worker(position: SearchPosition, iterations: Optional[int], time_limit: Optional[float], seed: int):
+    return _worker_search.search(position, iterations=iterations, time_limit=time_limit, seed=seed)
+
+
+class MCTSPolicy:
+
+    """Most visited root move over ``trees`` root-parallel searches of ``iterations`` and/or ``time_limit``.
+
+    ``workers`` only decides where the trees grow, so an iteration budget gives the same move for any count.
+    """
+
+    def __init__(
+        self,
+        cards: Sequence[Card],
+        *,
+        settings: GameSettings = GameSettings(),
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        trees: int = DEFAULT_TREE_COUNT,
+        workers: int = 1,
+        exploration: float = DEFAULT_EXPLORATION,
+        seed: Optional[int] = None,
+    ):
+        self._search = MonteCarloTreeSearch(cards, settings=settings, exploration=exploration)
+        self._iterations = DEFAULT_ITERATIONS if iterations is None and time_limit is None else iterations
+        self._time_limit = time_limit
+        self._trees = trees
+        self._workers = workers
+        self._random = Random(seed)
+        self._executor = (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_worker,
+                initargs=(tuple(cards), settings, exploration),
+            )
+            if workers > 1 else None
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __call__(self, player: Player, opponent_player: Player, permitted_actions: list[PlayerCardAction]):
+        moves = get_player_moves(player, permitted_actions)
+        if len(moves) == 1:
+            return moves[0]
+
+        position = self._search.get_position(player, opponent_player, permitted_actions)
+        visits: dict[MoveKey, int] = {}
+        for statistics in self._get_search_statistics(position):
+            for move_key, (move_visits, _) in statistics.items():
+                visits[move_key] = visits.get(move_key, 0) + move_visits
+
+        best_card_id, best_action = max(visits, key=visits.get)
+        return next(
+            (card, action)
+            for card, action in moves
+            if action == best_action and self._search.get_card_id(card) == best_card_id
+        )
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_search_statistics(self, position: SearchPosition):
+        seeds = [self._random.getrandbits(64) for _ in range(self._trees)]
+        iterations = -(-self._iterations // self._trees) if self._iterations is not None else None
+        # The trees run in rounds of ``workers``; each round gets its share of the time.
+        rounds = -(-self._trees // self._workers)
+        time_limit = self._time_limit / rounds if self._time_limit is not None else None
+        if self._executor is None:
+            return [
+                self._search.search(position, iterations=iterations, time_limit=time_limit, seed=seed)
+                for seed in seeds
+            ]
+
+        return self._executor.map(
+            _search_in_worker,
+            [position] * self._trees,
+            [iterations] * self._trees,
+            [time_limit] * self._trees,
+            seeds,
+        )
@@ -1,29 +1,48 @@
+from typing import Optional
+
 from .card import Card
 from .exceptions import PlayerResourceNonFoundError
-from .resource import Resource, ResourceType
+from .resource import RESOURCE_COUNT, Resource, ResourceType, get_resource_index
 
 
 class Player:
 
     def __init__(self, name: str):
         self._name = name
-        self._resources: list[Resource] = []
+        # Indexed by ``get_resource_index``; ``None`` marks a missing resource.
+        self._resources: list[Optional[Resource]] = [None] * RESOURCE_COUNT
         self._cards: list[Card] = []
 
     def __string__(self):
         return self._name
 
+    def copy(self):
+        """Copy the resources and the hand; the cards themselves are shared."""
+        player = Player(self._name)
+        player.resources = [Resource(resource.resource_type, resource.value) for resource in self.resources]
+        player.cards = list(self._cards)
+        return player
+
     @property
     def name(self):
         return self._name
 
     @property
     def resources(self):
-        return self._resources
+        return [resource for resource in self._resources if resource is not None]
 
     @resources.setter
     def resources(self, resources: list[Resource]):
-        self._resources = resources
+        self._resources = [None] * RESOURCE_COUNT
+        for resource in resources:
+            self._resources[get_resource_index(resource.resource_type)] = resource
+
+    @property
+    def resource_values(self):
+        """Values of all resources ordered by ``get_resource_index``."""
+        if None in self._resources:
+            raise PlayerResourceNonFoundError
+        return tuple(resource.value for resource in self._resources)
 
     @property
     def cards(self):
@@ -36,15 +55,21 @@ class Player:
     def add_card(self, card: Card, index: int):
         self.cards[index] = card
 
+    def has_card(self, card: Card):
+        return any(hand_card is card for hand_card in self._cards)
+
     def get_card_index(self, card: Card):
-        return self.cards.index(card)
+        # By identity: ``Card.__eq__`` compares every field and is the slowest part of a lookup.
+        for index, hand_card in enumerate(self._cards):
+            if hand_card is card:
+                return index
+        raise ValueError("card is not in the hand")
 
     def get_card_by_index(self, index: int):
         return self.cards[index]
 
     def get_resource_by_type(self, resource_type: ResourceType):
-        for resource in self.resources:
-            if resource.resource_type == resource_type:
-                return resource
-
-        raise PlayerResourceNonFoundError
+        resource = self._resources[get_resource_index(resource_type)]
+        if resource is None:
+            raise PlayerResourceNonFoundError
+        return resource
@@ -1,7 +1,17 @@
 from dataclasses import dataclass
+from typing import Iterable, Optional
 
 from .enums import ResourceType, ResourceBoundaryValueType
 from .decorators import non_negative
+from .exceptions import NegativeValueError
+
+
+RESOURCE_COUNT = len(ResourceType)
+
+
+def get_resource_index(resource_type: ResourceType):
+    # ``_value_`` skips the ``Enum.value`` descriptor, which is several times slower.
+    return resource_type._value_ - 1
 
 
 class Resource:
@@ -22,18 +32,22 @@ class Resource:
     def value(self):
         return self._value
 
+    # The setters check their argument inline; ``non_negative`` costs a wrapper call on every resource change.
     @value.setter
-    @non_negative
     def value(self, value):
+        if value < 0:
+            raise NegativeValueError
         self._value = value
 
-    @non_negative
     def increase_value(self, value: int):
-        self.value += value
+        if value < 0:
+            raise NegativeValueError
+        self._value += value
 
-    @non_negative
     def decrease_value(self, value: int):
-        self.value = max(self._value - value, 0)
+        if value < 0:
+            raise NegativeValueError
+        self._value = max(self._value - value, 0)
 
 
 @dataclass(frozen=True)
@@ -42,3 +56,63 @@ class ResourceBoundaryValue:
     resource_type: ResourceType
     resource_boundary_value_type: ResourceBoundaryValueType
     value: int
+
+
+class ResourceBoundaryTable:
+
+    """Per-resource thresholds compiled from ``ResourceBoundaryValue`` items.
+
+    Several boundaries of one type on one resource collapse into the most
+    restrictive one, so any of them being reached is a single comparison.
+    """
+
+    def __init__(self, boundary_values: Iterable[ResourceBoundaryValue]):
+        self._lower_values: list[Optional[int]] = [None] * RESOURCE_COUNT
+        self._upper_values: list[Optional[int]] = [None] * RESOURCE_COUNT
+
+        for boundary_value in boundary_values:
+            index = get_resource_index(boundary_value.resource_type)
+            match boundary_value.resource_boundary_value_type:
+                case ResourceBoundaryValueType.LOWER:
+                    lower_value = self._lower_values[index]
+                    self._lower_values[index] = (
+                        boundary_value.value if lower_value is None
+                        else max(lower_value, boundary_value.value)
+                    )
+                case ResourceBoundaryValueType.UPPER:
+                    upper_value = self._upper_values[index]
+                    self._upper_values[index] = (
+                        boundary_value.value if upper_value is None
+                        else min(upper_value, boundary_value.value)
+                    )
+
+        self._resource_types = tuple(
+            resource_type
+            for resource_type in ResourceType
+            if self._lower_values[get_resource_index(resource_type)] is not None
+            or self._upper_values[get_resource_index(resource_type)] is not None
+        )
+
+    @property
+    def resource_types(self):
+        return self._resource_types
+
+    def is_value_reached(
+        self,
+        resource_type: ResourceType,
+        value: int,
+        boundary_value_type: Optional[ResourceBoundaryValueType] = None,
+    ):
+        index = get_resource_index(resource_type)
+        lower_value = self._lower_values[index]
+        upper_value = self._upper_values[index]
+        match boundary_value_type:
+            case ResourceBoundaryValueType.LOWER:
+                return lower_value is not None and value <= lower_value
+            case ResourceBoundaryValueType.UPPER:
+                return upper_value is not None and value >= upper_value
+            case _:
+                return (
+                    (lower_value is not None and value <= lower_value)
+                    or (upper_value is not None and value >= upper_value)
+                )
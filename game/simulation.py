@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from random import Random
+from typing import Optional
+
+from .card import Card
+from .counters import CounterRegistry
+from .deck import DeckInitializer
+from .enums import PlayerCardAction
+from .exceptions import InvalidPlayerMoveError
+from .game import Game, GameSettings, MovePolicy
+from .helpers import can_card_be_applied, get_player_moves, is_player_action_allowed
+from .journal import Delta, Journal, TurnDelta
+from .player import Player
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+
+    winner: Optional[Player]
+    turn_count: int
+
+
+class RandomMovePolicy:
+
+    def __init__(self, seed: Optional[int] = None):
+        self._random = Random(seed)
+
+    def __call__(self, player: Player, opponent_player: Player, permitted_actions: list[PlayerCardAction]):
+        return self._random.choice(get_player_moves(player, permitted_actions))
+
+
+class HeadlessGame(Game):
+
+    def __init__(
+        self,
+        *,
+        first_player_policy: MovePolicy,
+        second_player_policy: MovePolicy,
+        settings: GameSettings,
+        deck_initializer: DeckInitializer,
+        first_player: Player,
+        second_player: Player,
+        random: Optional[Random] = None,
+        journal: Optional[Journal] = None,
+        counters: Optional[CounterRegistry] = None,
+    ):
+        super().__init__(
+            interface=None,
+            settings=settings,
+            deck_initializer=deck_initializer,
+            first_player=first_player,
+            second_player=second_player,
+            random=random,
+            journal=journal,
+            counters=counters,
+            policies={
+                first_player: first_player_policy,
+                second_player: second_player_policy,
+            },
+        )
+        self._turn_count = 0
+
+    def run(self):
+        self._initialize()
+        return self._play()
+
+    def run_from_position(self, permitted_actions: list[PlayerCardAction]):
+        """Play out a game whose players are already dealt; the first one moves with ``permitted_actions``."""
+        self._deck_initializer.initialize(self._deck)
+        self._start()
+        # Only a DISCARD_AND_PLAY_AGAIN card grants an action after the one to play now.
+        if permitted_actions == PlayerCardAction.discard_actions():
+            self._pending_actions = (permitted_actions, PlayerCardAction.all_actions())
+        return self._play()
+
+    def _play(self):
+        while not self._is_over():
+            self._handle_player_move()
+        return SimulationResult(winner=self._get_winner_player(), turn_count=self._turn_count)
+
+    def _get_player_input(self, permitted_actions: list[PlayerCardAction]):
+        policy = self._policies[self._current_player]
+        return policy(self._current_player, self._get_opponent_to(self._current_player), permitted_actions)
+
+    def _is_player_input_valid(
+        self,
+        card: Optional[Card],
+        action: Optional[PlayerCardAction],
+        permitted_actions: list[PlayerCardAction],
+    ):
+        if (
+            not self._current_player.has_card(card)
+            or not is_player_action_allowed(permitted_actions, action)
+            or (action == PlayerCardAction.APPLY and not can_card_be_applied(card, self._current_player))
+        ):
+            raise InvalidPlayerMoveError
+        return True
+
+    def _apply_move(self):
+        super()._apply_move()
+        self._turn_count += 1
+
+    def _set_interface_players(self):
+        pass
+
+    def _apply_delta(self, delta: Delta):
+        super()._apply_delta(delta)
+        if isinstance(delta, TurnDelta) and delta.new_player is not delta.old_player:
+            self._turn_count += 1
+
+    def _revert_delta(self, delta: Delta):
+        super()._revert_delta(delta)
+        if isinstance(delta, TurnDelta) and delta.new_player is not delta.old_player:
+            self._turn_count -= 1
+
+
+def simulate_game(
+    first_player_policy: MovePolicy,
+    second_player_policy: MovePolicy,
+    *,
+    settings: GameSettings = GameSettings(),
+    deck_initializer: DeckInitializer,
+    seed: Optional[int] = None,
+    counters: Optional[CounterRegistry] = None,
+):
+    game = HeadlessGame(
+        first_player_policy=first_player_policy,
+        second_player_policy=second_player_policy,
+        settings=settings,
+        deck_initializer=deck_initializer,
+        first_player=Player("Player 1"),
+        second_player=Player("Player 2"),
+        random=Random(seed),
+        counters=counters,
+    )
+    return game.run()
@@ -0,0 +1,214 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import permutations
+from random import Random
+from typing import Callable, Iterator, Optional, Sequence
+
+from .card import Card
+from .deck import DeckFromCacheInitializer, DeckFromCardsInitializer
+from .game import GameSettings
+from .mcts import MCTSPolicy
+from .player import Player
+from .simulation import HeadlessGame, MovePolicy, RandomMovePolicy
+
+
+WILSON_Z_95 = 1.96
+
+
+def create_random_policy(cards: tuple[Card, ...], seed: int):
+    return RandomMovePolicy(seed)
+
+
+def create_mcts_policy(cards: tuple[Card, ...], seed: int, **kwargs):
+    return MCTSPolicy(cards, seed=seed, **kwargs)
+
+
+@dataclass(frozen=True)
+class Strategy:
+
+    """A named policy factory; ``create_policy(cards, seed)`` runs in worker processes, so it must pickle."""
+
+    name: str
+    create_policy: Callable[[tuple[Card, ...], int], MovePolicy]
+
+
+@dataclass(frozen=True)
+class TournamentJob:
+
+    first_strategy_index: int
+    second_strategy_index: int
+    seed: int
+    settings: GameSettings
+
+
+@dataclass(frozen=True)
+class GameRecord:
+
+    first_strategy_name: str
+    second_strategy_name: str
+    seed: int
+    winner_strategy_name: Optional[str]
+    turn_count: int
+
+
+@dataclass(frozen=True)
+class WinRate:
+
+    wins: int
+    losses: int
+    draws: int
+    rate: float
+    lower_bound: float
+    upper_bound: float
+
+    @property
+    def game_count(self):
+        return self.wins + self.losses + self.draws
+
+
+def get_wilson_interval(score: float, count: int, z: float = WILSON_Z_95):
+    if count == 0:
+        return 0.0, 1.0
+    rate = score / count
+    denominator = 1 + z ** 2 / count
+    center = (rate + z ** 2 / (2 * count)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / count + z ** 2 / (4 * count ** 2)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class TournamentResult:
+
+    def __init__(self, strategy_names: Sequence[str], records: Sequence[GameRecord]):
+        self._strategy_names = tuple(strategy_names)
+        self.records = tuple(records)
+
+    def get_win_rate(self, strategy_name: str, opponent_strategy_name: Optional[str] = None):
+        """Win rate of a strategy against one opponent, or against the whole field. Draws count as half a win."""
+        wins = losses = draws = 0
+        for record in self.records:
+            players = (record.first_strategy_name, record.second_strategy_name)
+            if strategy_name not in players or (
+                opponent_strategy_name is not None and opponent_strategy_name not in players
+            ):
+                continue
+            if record.winner_strategy_name is None:
+                draws += 1
+            elif record.winner_strategy_name == strategy_name:
+                wins += 1
+            else:
+                losses += 1
+
+        count = wins + losses + draws
+        score = wins + draws / 2
+        return WinRate(
+            wins,
+            losses,
+            draws,
+            score / count if count else 0.0,
+            *get_wilson_interval(score, count),
+        )
+
+    def get_win_rates(self):
+        return {
+            (strategy_name, opponent_strategy_name): self.get_win_rate(strategy_name, opponent_strategy_name)
+            for strategy_name, opponent_strategy_name in permutations(self._strategy_names, 2)
+        }
+
+
+_worker_cards: tuple[Card, ...] = ()
+_worker_deck_initializer: Optional[DeckFromCardsInitializer] = None
+_worker_strategies: tuple[Strategy, ...] = ()
+
+
+def _initialize_worker(strategies: tuple[Strategy, ...]):
+    global _worker_cards, _worker_deck_initializer, _worker_strategies
+    _worker_cards = tuple(DeckFromCacheInitializer.load_cards())
+    _worker_deck_initializer = DeckFromCardsInitializer(_worker_cards)
+    _worker_strategies = strategies
+
+
+def _play_games(jobs: Sequence[TournamentJob]):
+    return [_play_game(job) for job in jobs]
+
+
+def _play_game(job: TournamentJob):
+    first_strategy = _worker_strategies[job.first_strategy_index]
+    second_strategy = _worker_strategies[job.second_strategy_index]
+    first_player = Player(first_strategy.name)
+    second_player = Player(second_strategy.name)
+    # Offsets like ``job.seed + 1`` would collide with the seeds of the next job.
+    random = Random(job.seed)
+    deck_seed, first_policy_seed, second_policy_seed = (random.getrandbits(64) for _ in range(3))
+    game = HeadlessGame(
+        first_player_policy=first_strategy.create_policy(_worker_cards, first_policy_seed),
+        second_player_policy=second_strategy.create_policy(_worker_cards, second_policy_seed),
+        settings=job.settings,
+        deck_initializer=_worker_deck_initializer,
+        first_player=first_player,
+        second_player=second_player,
+        random=Random(deck_seed),
+    )
+    result = game.run()
+    return GameRecord(
+        first_strategy.name,
+        second_strategy.name,
+        job.seed,
+        result.winner.name if result.winner is not None else None,
+        result.turn_count,
+    )
+
+
+class Tournament:
+
+    """Round-robin of seeded games between every ordered pair of strategies; both seatings play the same deals."""
+
+    def __init__(
+        self,
+        strategies: Sequence[Strategy],
+        *,
+        games_per_pair: int,
+        settings: GameSettings = GameSettings(),
+        seed: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        if len({strategy.name for strategy in strategies}) != len(strategies):
+            raise ValueError("Strategy names must be unique.")
+        self._strategies = tuple(strategies)
+        self._games_per_pair = games_per_pair
+        self._settings = settings
+        self._seed = seed
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._chunk_size = chunk_size
+
+    def get_jobs(self):
+        return [
+            TournamentJob(first_strategy_index, second_strategy_index, self._seed + game_index, self._settings)
+            for first_strategy_index, second_strategy_index in permutations(range(len(self._strategies)), 2)
+            for game_index in range(self._games_per_pair)
+        ]
+
+    def run(self):
+        return TournamentResult([strategy.name for strategy in self._strategies], list(self.iter_records()))
+
+    def iter_records(self) -> Iterator[GameRecord]:
+        jobs = self.get_jobs()
+        chunk_size = self._chunk_size or max(1, len(jobs) // (self._workers * 8))
+        chunks = [jobs[index:index + chunk_size] for index in range(0, len(jobs), chunk_size)]
+
+        if self._workers == 1:
+            _initialize_worker(self._strategies)
+            for chunk in chunks:
+                yield from _play_games(chunk)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_initialize_worker,
+            initargs=(self._strategies,),
+        ) as executor:
+            futures = [executor.submit(_play_games, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
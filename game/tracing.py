@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Iterable, Optional
+
+
+class Tracer:
+
+    """Completed spans, written as Chrome Trace Event JSON for Perfetto or chrome://tracing.
+
+    Threads record with one atomic ``list.append``, so without a lock.
+    """
+
+    def __init__(self):
+        # (name, category, start, end, thread id, args) with times in nanoseconds.
+        self._spans: list[tuple[str, str, int, int, int, Optional[dict]]] = []
+        # Names are taken while the threads are alive; threads may be gone when the trace is written.
+        self._thread_names: dict[int, str] = {}
+
+    def __len__(self):
+        return len(self._spans)
+
+    def add_span(self, name: str, category: str, start: int, end: int, args: Optional[dict] = None):
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self._spans.append((name, category, start, end, thread_id, args))
+
+    def get_trace_events(self):
+        process_id = os.getpid()
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": process_id,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in list(self._thread_names.items())
+        ]
+        events.extend(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": process_id,
+                "tid": thread_id,
+                **({"args": args} if args is not None else {}),
+            }
+            for name, category, start, end, thread_id, args in self._spans
+        )
+        return events
+
+    def write(self, path: str):
+        write_trace_events(path, self.get_trace_events())
+
+
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing():
+    """Record spans of every ``traced`` function into a new tracer until ``stop_tracing``."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing():
+    """Stop recording and return the tracer, or None if tracing was not started."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def traced(name: Optional[str] = None, category: str = "game", get_args: Optional[Callable[..., dict]] = None):
+    """Record every call of the decorated function as a span while tracing; costs one check otherwise.
+
+    ``get_args``, called with the arguments of the call, returns the span arguments.
+    """
+    def decorator(func):
+        span_name = name if name is not None else func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.add_span(
+                    span_name,
+                    category,
+                    start,
+                    perf_counter_ns(),
+                    get_args(*args, **kwargs) if get_args is not None else None,
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def write_trace_events(path: str, events: list[dict]):
+    with open(path, "w") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+def merge_trace_files(paths: Iterable[str], path: str):
+    """Merge traces written by several processes, e.g. simulation workers, into one file."""
+    events = []
+    for trace_path in paths:
+        with open(trace_path) as file:
+            events.extend(json.load(file)["traceEvents"])
+    write_trace_events(path, events)
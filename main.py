@@ -1,18 +1,29 @@
-from game.deck import DeckFromFileInitializer
+import os
+
+from game.deck import DeckFromCacheInitializer, DeckFromCardsInitializer
 from game.interface import GraphicalInterface
 from game.game import Game, GameSettings
+from game.mcts import MCTSPolicy
 from game.player import Player
 
 
+COMPUTER_MOVE_TIME_LIMIT = 2.0
+
+
 def main():
-    game = Game(
-        interface=GraphicalInterface(),
-        settings=GameSettings(),
-        deck_initializer=DeckFromFileInitializer(),
-        first_player=Player("Player 1"),
-        second_player=Player("Player 2"),
-    )
-    game.run()
+    cards = DeckFromCacheInitializer.load_cards()
+    interface = GraphicalInterface(cards)
+    computer_player = Player("Computer")
+    with MCTSPolicy(cards, time_limit=COMPUTER_MOVE_TIME_LIMIT, workers=os.cpu_count() or 1) as policy:
+        game = Game(
+            interface=interface,
+            settings=GameSettings(),
+            deck_initializer=DeckFromCardsInitializer(cards),
+            first_player=Player("Player 1"),
+            second_player=computer_player,
+            policies={computer_player: policy},
+        )
+        interface.run(game.run)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,14 @@
+import pathlib
+from unittest import mock
+
+from game.deck import Deck, DeckFromFileInitializer
+
+
+CARDS_FILE_PATH = pathlib.Path(__file__).absolute().parent.parent / "cards.xml"
+
+
+def load_cards():
+    deck = Deck()
+    with mock.patch.object(DeckFromFileInitializer, "FILE_PATH", CARDS_FILE_PATH):
+        DeckFromFileInitializer.initialize(deck)
+    return deck.cards
@@ -0,0 +1,87 @@
+import unittest
+from random import Random
+
+import numpy as np
+
+from game.batch import NO_WINNER, BatchCardTable, BatchGame
+from game.deck import DeckFromCardsInitializer
+from game.game import GameSettings
+from game.player import Player
+from game.simulation import HeadlessGame, RandomMovePolicy
+from .helpers import load_cards
+
+
+GAME_COUNT = 100
+
+
+class RecordingMovePolicy(RandomMovePolicy):
+
+    def __init__(self, seed: int, moves: list[tuple[int, int]]):
+        super().__init__(seed)
+        self._moves = moves
+
+    def __call__(self, player, opponent_player, permitted_actions):
+        card, action = super().__call__(player, opponent_player, permitted_actions)
+        self._moves.append((player.get_card_index(card), action.value))
+        return card, action
+
+
+class BatchGameTest(unittest.TestCase):
+
+    """``BatchGame`` replaying the moves of seeded ``HeadlessGame`` games."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cards = load_cards()
+        cls.card_table = BatchCardTable(cls.cards)
+
+    def test_step_matches_headless_game(self):
+        players, results, moves = [], [], []
+        for seed in range(GAME_COUNT):
+            game_players = (Player("Player 1"), Player("Player 2"))
+            game_moves = []
+            game = HeadlessGame(
+                first_player_policy=RecordingMovePolicy(seed, game_moves),
+                second_player_policy=RecordingMovePolicy(seed + GAME_COUNT, game_moves),
+                settings=GameSettings(),
+                deck_initializer=DeckFromCardsInitializer(self.cards),
+                first_player=game_players[0],
+                second_player=game_players[1],
+                random=Random(seed),
+            )
+            players.append(game_players)
+            results.append(game.run())
+            moves.append(game_moves)
+
+        batch_game = self._get_batch_game(range(GAME_COUNT))
+        for move_index in range(max(len(game_moves) for game_moves in moves)):
+            slots, actions = np.zeros(GAME_COUNT, dtype=np.intp), np.ones(GAME_COUNT, dtype=np.int8)
+            for game_index, game_moves in enumerate(moves):
+                if move_index < len(game_moves):
+                    slots[game_index], actions[game_index] = game_moves[move_index]
+            batch_game.step(slots, actions)
+
+        for game_index, (game_players, result) in enumerate(zip(players, results)):
+            with self.subTest(seed=game_index):
+                self.assertEqual(
+                    batch_game.resources[game_index].tolist(),
+                    [list(player.resource_values) for player in game_players],
+                )
+                expected_winner = NO_WINNER if result.winner is None else game_players.index(result.winner)
+                self.assertEqual(batch_game.winner[game_index], expected_winner)
+                self.assertEqual(batch_game.turn_count[game_index], result.turn_count)
+
+    def _get_batch_game(self, seeds):
+        hand_size = GameSettings().player_card_count
+        batch_game = BatchGame(self.card_table, len(seeds))
+        for game_index, seed in enumerate(seeds):
+            # The order ``Deck.shuffle`` deals in: card ids follow the initializer order.
+            order = list(range(len(self.cards)))
+            Random(seed).shuffle(order)
+            batch_game.hands[game_index] = np.reshape(order[:2 * hand_size], (2, hand_size))
+            batch_game.decks[game_index, :-1] = order[2 * hand_size:]
+        return batch_game
+
+
+if __name__ == "__main__":
+    unittest.main()
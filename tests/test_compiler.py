@@ -0,0 +1,51 @@
+import unittest
+from random import Random
+
+from game.game import PlayerCardApplier
+from game.player import Player
+from game.resource import Resource, ResourceType
+from .helpers import load_cards
+
+
+STATE_COUNT = 200
+MAX_RESOURCE_VALUE = 40
+
+
+def get_random_player(name: str, random: Random):
+    player = Player(name)
+    player.resources = [
+        Resource(resource_type, random.randint(0, MAX_RESOURCE_VALUE)) for resource_type in ResourceType
+    ]
+    return player
+
+
+class CardCompilerTest(unittest.TestCase):
+
+    """Compiled card effects against the ``PlayerCardApplier`` reference interpreter."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cards = load_cards()
+
+    def test_cards_are_loaded(self):
+        self.assertEqual(len(self.cards), 102)
+
+    def test_effect_matches_player_card_applier(self):
+        random = Random(0)
+        for _ in range(STATE_COUNT):
+            players = (get_random_player("Player 1", random), get_random_player("Player 2", random))
+            for card_index, card in enumerate(self.cards):
+                with self.subTest(card=card_index, title=card.title):
+                    expected_players = [player.copy() for player in players]
+                    PlayerCardApplier(*expected_players).apply_card(card)
+                    actual_players = [player.copy() for player in players]
+                    card.effect(*actual_players)
+
+                    self.assertEqual(
+                        [player.resource_values for player in actual_players],
+                        [player.resource_values for player in expected_players],
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
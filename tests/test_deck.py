@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from game.deck import DeckFromCacheInitializer, DeckFromFileInitializer
+from .helpers import CARDS_FILE_PATH, load_cards
+
+
+class DeckFromCacheInitializerTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_file_path = os.path.join(directory.name, "cards.cache")
+        for target, attribute, value in (
+            (DeckFromFileInitializer, "FILE_PATH", CARDS_FILE_PATH),
+            (DeckFromCacheInitializer, "CACHE_FILE_PATH", self.cache_file_path),
+        ):
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_cached_cards_match_xml(self):
+        expected_cards = load_cards()
+        self.assertEqual(list(DeckFromCacheInitializer.load_cards()), expected_cards)
+        self.assertTrue(os.path.exists(self.cache_file_path))
+
+        with mock.patch.object(DeckFromFileInitializer, "initialize") as initialize:
+            self.assertEqual(list(DeckFromCacheInitializer.load_cards()), expected_cards)
+        initialize.assert_not_called()
+
+    def test_corrupt_cache_is_rebuilt(self):
+        expected_cards = DeckFromCacheInitializer.load_cards()
+        with open(self.cache_file_path, "rb") as file:
+            cache = file.read()
+        with open(self.cache_file_path, "wb") as file:
+            file.write(cache[:len(cache) // 2])
+
+        self.assertEqual(DeckFromCacheInitializer.load_cards(), expected_cards)
+        with open(self.cache_file_path, "rb") as file:
+            self.assertEqual(file.read(), cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
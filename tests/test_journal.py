@@ -0,0 +1,98 @@
+import unittest
+from random import Random
+
+from game.deck import DeckFromCardsInitializer
+from game.enums import CardAdditionalFeature, PlayerCardAction
+from game.exceptions import InvalidPlayerMoveError
+from game.game import GameSettings
+from game.helpers import get_player_moves
+from game.journal import Journal
+from game.player import Player
+from game.simulation import HeadlessGame, RandomMovePolicy
+from .helpers import load_cards
+
+
+GAME_COUNT = 50
+
+
+class JournalTest(unittest.TestCase):
+
+    """``Game.step`` with undo and redo over seeded random games."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cards = load_cards()
+
+    def test_undo_and_redo_round_trip(self):
+        for seed in range(GAME_COUNT):
+            with self.subTest(seed=seed):
+                random = Random(seed)
+                game = self._get_game(seed)
+                game.initialize()
+                states = [JournalTest._get_state(game)]
+                while not game.is_over:
+                    game.step(*random.choice(get_player_moves(game.current_player, game.permitted_actions)))
+                    states.append(JournalTest._get_state(game))
+
+                for state in reversed(states[:-1]):
+                    game.undo()
+                    self.assertEqual(JournalTest._get_state(game), state)
+                for state in states[1:]:
+                    game.redo()
+                    self.assertEqual(JournalTest._get_state(game), state)
+
+    def test_undo_in_the_middle_of_a_move(self):
+        game = self._get_game(0)
+        game.initialize()
+        random = Random(0)
+        while game.permitted_actions != PlayerCardAction.discard_actions():
+            moves = get_player_moves(game.current_player, game.permitted_actions)
+            discard_and_play_again_moves = [
+                (card, action)
+                for card, action in moves
+                if action == PlayerCardAction.APPLY
+                and card.has_additional_feature(CardAdditionalFeature.DISCARD_AND_PLAY_AGAIN)
+            ]
+            game.step(*random.choice(discard_and_play_again_moves or moves))
+
+        player = game.current_player
+        card = player.cards[0]
+        with self.assertRaises(InvalidPlayerMoveError):
+            game.step(card, PlayerCardAction.APPLY)
+        game.step(card, PlayerCardAction.DISCARD)
+        self.assertIs(game.current_player, player)
+        self.assertEqual(game.permitted_actions, PlayerCardAction.all_actions())
+
+        game.undo()
+        self.assertIs(game.current_player, player)
+        self.assertEqual(game.permitted_actions, PlayerCardAction.discard_actions())
+        self.assertIs(player.cards[0], card)
+
+    def _get_game(self, seed: int):
+        return HeadlessGame(
+            first_player_policy=RandomMovePolicy(seed),
+            second_player_policy=RandomMovePolicy(seed),
+            settings=GameSettings(),
+            deck_initializer=DeckFromCardsInitializer(self.cards),
+            first_player=Player("Player 1"),
+            second_player=Player("Player 2"),
+            random=Random(seed),
+            journal=Journal(),
+        )
+
+    @staticmethod
+    def _get_state(game: HeadlessGame):
+        return (
+            game.current_player.name,
+            game.permitted_actions,
+            game.is_over,
+            [
+                (player.resource_values, list(player.cards))
+                for player in (game.current_player, game.opponent_player)
+            ],
+            game._deck.cards,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from random import Random
+
+from game.deck import DeckFromCardsInitializer
+from game.game import GameSettings
+from game.helpers import get_player_moves
+from game.mcts import MCTSPolicy
+from game.player import Player
+from game.simulation import HeadlessGame, RandomMovePolicy
+from .helpers import load_cards
+
+
+POSITION_COUNT = 3
+ITERATIONS = 64
+
+
+class MCTSPolicyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cards = load_cards()
+
+    def test_move_is_legal_and_independent_of_workers(self):
+        moves = {}
+        for workers in (1, 2):
+            with MCTSPolicy(self.cards, iterations=ITERATIONS, workers=workers, seed=0) as policy:
+                moves[workers] = [policy(*position) for position in self._get_positions()]
+
+        for position, move in zip(self._get_positions(), moves[1]):
+            self.assertIn(move, get_player_moves(position[0], position[2]))
+        self.assertEqual(moves[1], moves[2])
+
+    def _get_positions(self):
+        game = HeadlessGame(
+            first_player_policy=RandomMovePolicy(0),
+            second_player_policy=RandomMovePolicy(0),
+            settings=GameSettings(),
+            deck_initializer=DeckFromCardsInitializer(self.cards),
+            first_player=Player("Player 1"),
+            second_player=Player("Player 2"),
+            random=Random(0),
+        )
+        game.initialize()
+        random = Random(0)
+        for _ in range(POSITION_COUNT):
+            yield game.current_player, game.opponent_player, game.permitted_actions
+            game.step(*random.choice(get_player_moves(game.current_player, game.permitted_actions)))
+
+
+if __name__ == "__main__":
+    unittest.main()